@@ -0,0 +1,153 @@
+"""
+Content-addressed asset pipeline for course media.
+
+Slides refer to their media as ../ASSETS/<name>. AssetStore.resolve() takes
+such a reference (or a local file path), hashes the file and stores it in the
+course's ASSETS folder as <sha256 prefix>.<ext>; the slide is then written
+with that name instead. Because a name only ever belongs to one content, the
+files can be served with immutable, far-future cache headers.
+
+Every blob is also kept once in a shared store (~/.ela-assets by default) and
+hard-linked into each course that uses it, so the same lecture video takes
+disk space once no matter how many courses include it. Where hard links are
+not possible (another filesystem, Windows shares) the file is copied instead.
+
+Files uploaded into ASSETS under their own name stay where the author put
+them; the store and the hashed name are hard links to the upload (no copy),
+and export.py leaves the original name out of the package. Stored blobs are
+read-only (0444), the linked upload included, so a blob shared by several
+courses cannot be edited in place behind their hashes: saving over the
+upload fails, and an editor that writes a new file and renames it over the
+upload leaves the blob alone (the next build stores the new content under a
+new name). Files elsewhere on disk are copied into the store instead, so
+editing them afterwards cannot change a stored blob either.
+
+Stored files are written to a temporary name and renamed into place, so
+several builder processes can ingest the same asset at once. They go
+straight into the live ASSETS folder even during a staged build: a new
+content-addressed name never replaces anything a page already points to.
+"""
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+
+from media import is_remote, media_extension
+
+SHARED_STORE = os.path.join(os.path.expanduser("~"), ".ela-assets")
+
+HASH_LENGTH = 20
+CHUNK_SIZE = 1024 * 1024
+# readable by the web server, writable by no one: every course linking a
+# blob shares it
+ASSET_MODE = 0o444
+
+# ASSETS subfolders written by the build itself, never uploads
+BUILD_DIRS = frozenset(["js", "vendor"])
+
+STORED_NAME = re.compile(r"[0-9a-f]{%d}(\.[^./\\]+)?" % HASH_LENGTH)
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def place(source, target, link=True):
+    # Puts source at target via a temporary name, hard-linking when allowed.
+    folder = os.path.dirname(target)
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".ingest-", dir=folder)
+    os.close(fd)
+    try:
+        os.unlink(tmp_path)
+        linked = False
+        if link:
+            try:
+                os.link(source, tmp_path)
+                linked = True
+            except OSError:
+                pass
+        if not linked:
+            shutil.copyfile(source, tmp_path)
+            # mkstemp-style private modes would hide the file from the web server
+            os.chmod(tmp_path, ASSET_MODE)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class AssetStore:
+    def __init__(self, assets_dir, shared_dir=SHARED_STORE):
+        self.assets_dir = assets_dir
+        self.shared_dir = shared_dir
+        # (path, mtime_ns, size) -> sha256, so unchanged files are hashed once
+        self._digests = {}
+
+    def digest(self, path):
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        if key not in self._digests:
+            self._digests[key] = file_digest(path)
+        return self._digests[key]
+
+    def source_path(self, mediaFileUrl):
+        # A reference is either relative to ASSETS/ (what the wizard asks for)
+        # or a path to a file anywhere on disk.
+        candidates = [os.path.join(self.assets_dir, mediaFileUrl)]
+        if os.path.isabs(mediaFileUrl):
+            candidates.insert(0, mediaFileUrl)
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    def resolve(self, mediaFileUrl):
+        # Returns the content-addressed name for mediaFileUrl, or the reference
+        # unchanged for remote URLs and files that cannot be found.
+        if not mediaFileUrl or is_remote(mediaFileUrl):
+            return mediaFileUrl
+        if STORED_NAME.fullmatch(mediaFileUrl) and os.path.isfile(os.path.join(self.assets_dir, mediaFileUrl)):
+            # already resolved earlier in this build
+            return mediaFileUrl
+        source = self.source_path(mediaFileUrl)
+        if source is None:
+            return mediaFileUrl
+        return self.ingest(source, media_extension(mediaFileUrl))
+
+    def upload_name(self, source):
+        # Path of source relative to ASSETS if it is an upload, else None.
+        rel = os.path.relpath(os.path.abspath(source), os.path.abspath(self.assets_dir))
+        parts = rel.replace(os.sep, "/").split("/")
+        if parts[0] == ".." or parts[0] in BUILD_DIRS or STORED_NAME.fullmatch(rel):
+            return None
+        return rel
+
+    def ingest(self, source, extension=""):
+        digest = self.digest(source)
+        name = digest[:HASH_LENGTH] + (f".{extension}" if extension else "")
+        target = os.path.join(self.assets_dir, name)
+        upload = self.upload_name(source)
+        if upload is not None:
+            # it becomes the stored file (see the module docstring)
+            os.chmod(source, ASSET_MODE)
+        if not os.path.exists(target):
+            blob = source
+            if self.shared_dir:
+                blob = os.path.join(self.shared_dir, digest[:2], digest + (f".{extension}" if extension else ""))
+                if not os.path.exists(blob):
+                    place(source, blob, link=upload is not None)
+            place(blob, target, link=upload is not None or bool(self.shared_dir))
+        if upload is not None:
+            stored, uploaded = os.stat(target), os.stat(source)
+            if not os.path.samestat(stored, uploaded) and stored.st_dev == uploaded.st_dev:
+                # the content was stored before (by this course or another
+                # one): the upload becomes one more link to it
+                place(target, source)
+        return name
@@ -0,0 +1,71 @@
+"""
+PDF export benchmark for exporters.export_pdf.
+
+Builds a synthetic editor snapshot (--lines lines of prose, every few
+words bold, italic or underlined, some lines long enough to wrap) and
+reports pages per second and the peak memory of the export.
+
+Usage:
+    python bench_pdf.py [--lines 100000] [--repeat 3] [--output /tmp/bench.pdf]
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from exporters import FORMAT_TAGS, DocumentSnapshot, export_pdf
+
+WORDS = ("course module slide learner quiz answer progress lesson chapter video "
+         "assessment objective duration overview paragraph question").split()
+
+
+def make_snapshot(lines, seed=1):
+    rng = random.Random(seed)
+    parts = []
+    ranges = {tag: [] for tag in FORMAT_TAGS}
+    offset = 0
+    for i in range(lines):
+        words = [rng.choice(WORDS) for _ in range(rng.choice((0, 4, 8, 12, 30)))]
+        for word in words:
+            if rng.random() < 0.15:
+                ranges[rng.choice(FORMAT_TAGS)].append((offset, offset + len(word)))
+            parts.append(word + " ")
+            offset += len(word) + 1
+        parts.append("\n")
+        offset += 1
+    return DocumentSnapshot("".join(parts), ranges)
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the paginated PDF export.")
+    parser.add_argument("--lines", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=os.path.join(tempfile.gettempdir(), "bench_export.pdf"))
+    args = parser.parse_args(argv)
+
+    snapshot = make_snapshot(args.lines)
+    before = peak_rss_mb()
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        pages = export_pdf(snapshot, args.output)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    size = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"{args.lines} lines, {len(snapshot.text)} chars -> {pages} pages ({size:.1f} MB), best of {args.repeat}")
+    print(f"  {best:.2f} s, {pages / best:.0f} pages/s")
+    print(f"  peak RSS {peak_rss_mb():.0f} MB ({before:.0f} MB before the first export)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Per-slide render benchmark for CourseWriter.writeFileSlide.
+
+Builds a synthetic module of N slides (10,000 by default) and times the
+current writer against the per-line f.write writer from an older revision of
+dummy.py (the repository's first commit unless --legacy-ref is given).
+
+Two numbers are reported for each writer: "render" sends every file to
+os.devnull, so it measures markup generation and the write calls without the
+filesystem; "render+disk" writes real files into a temporary directory.
+Each measurement is the best of --repeat alternating runs.
+
+Usage:
+    python bench_render.py [--slides N] [--repeat R] [--legacy-ref REV]
+"""
+import argparse
+import builtins
+import contextlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+# header, media, paragraph, question, A, B, C, D, answer
+SAMPLE_SLIDES = [
+    ("Welcome", "intro.mp4", "An opening paragraph. " * 20, "", "", "", "", "", ""),
+    ("Pick one", "diagram.png", "Read the diagram. " * 10, "Which one?", "One", "Two", "Three", "Four", "Two"),
+    ("True or false", "notes.pdf", "", "Is it true?", "True", "False", "", "", "True"),
+    ("Short answer", "https://www.youtube.com/embed/abc", "Watch first.", "Name it", "", "", "", "", "tkinter"),
+]
+
+
+def load_legacy_creator(ref):
+    source = subprocess.run(["git", "show", f"{ref}:dummy.py"], cwd=HERE, check=True,
+                            stdout=subprocess.PIPE, text=True).stdout
+    module = types.ModuleType("legacy_dummy")
+    exec(compile(source, f"{ref}:dummy.py", "exec"), module.__dict__)
+    return module.Creator
+
+
+def first_commit():
+    return subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=HERE, check=True,
+                          stdout=subprocess.PIPE, text=True).stdout.split()[0]
+
+
+@contextlib.contextmanager
+def discard_output(namespaces):
+    # Points open() in the writer modules at os.devnull for the render-only runs.
+    def devnull_open(file, mode="r", *args, **kwargs):
+        return builtins.open(os.devnull, mode.replace("x", "w").replace("a", "w"), *args, **kwargs)
+
+    for namespace in namespaces:
+        namespace["open"] = devnull_open
+    try:
+        yield
+    finally:
+        for namespace in namespaces:
+            namespace.pop("open", None)
+
+
+def run(creator_class, slides, out_dir, legacy=False):
+    if legacy:
+        # the legacy Creator has no headless mode
+        creator = creator_class.__new__(creator_class)
+    else:
+        # no manifest is attached, so every slide is fully rendered
+        creator = creator_class()
+    creator.file_dir = out_dir
+    creator.courseTitle = "Benchmark"
+    module_dir = os.path.join(out_dir, "module1")
+    os.makedirs(module_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    for i in range(slides):
+        header, media, paragraph, question, a, b, c, d, answer = SAMPLE_SLIDES[i % len(SAMPLE_SLIDES)]
+        creator.writeFileSlide(f"{module_dir}/module_1_slide_{i + 1}.html", f"module_1_slide_{i + 1}.html",
+                               header, media, paragraph, question, a, b, c, d, answer,
+                               f"module_1_slide_{i + 2}.html", f"module_1_slide_{i}.html" if i else "",
+                               1, i + 1)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark slide rendering before/after templates.")
+    parser.add_argument("--slides", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-ref", default=None, help="git revision holding the old writer")
+    args = parser.parse_args(argv)
+
+    import course_writer
+    import templates
+    legacy = load_legacy_creator(args.legacy_ref or first_commit())
+    writers = {
+        "per-line f.write": (legacy, [legacy.writeFileSlide.__globals__]),
+        "templates": (course_writer.CourseWriter, [vars(course_writer), vars(templates)]),
+    }
+
+    results = {}
+    devnull = open(os.devnull, "w")
+    for _ in range(args.repeat):
+        for label, (creator_class, namespaces) in writers.items():
+            for kind in ("render", "render+disk"):
+                out_dir = tempfile.mkdtemp(prefix="ela-bench-")
+                stdout, sys.stdout = sys.stdout, devnull  # the writers print per file
+                try:
+                    if kind == "render":
+                        with discard_output(namespaces):
+                            seconds = run(creator_class, args.slides, out_dir, creator_class is legacy)
+                    else:
+                        seconds = run(creator_class, args.slides, out_dir, creator_class is legacy)
+                finally:
+                    sys.stdout = stdout
+                    shutil.rmtree(out_dir, ignore_errors=True)
+                key = (label, kind)
+                results[key] = min(seconds, results.get(key, seconds))
+    devnull.close()
+
+    print(f"{args.slides} slides, best of {args.repeat}")
+    for kind in ("render", "render+disk"):
+        before = results[("per-line f.write", kind)]
+        after = results[("templates", kind)]
+        print(f"{kind:>12}: before {before / args.slides * 1e6:7.1f} us/slide, "
+              f"after {after / args.slides * 1e6:7.1f} us/slide ({before / after:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Startup benchmark for the text editor (main.py).
+
+Compares the current main.py with an older revision (the repository's first
+commit unless --legacy-ref is given). Every measurement runs in a fresh
+interpreter, since startup cost is mostly imports:
+
+- "import": wall time of `python -X importtime -c "import main"`, with the
+  modules that took longest (cumulative, in ms) listed below it;
+- "first paint": from starting the interpreter until the editor's Text
+  widget has been exposed and drawn. Needs a display; skipped without one.
+
+Each number is the best of --repeat runs.
+
+Usage:
+    python bench_startup.py [--repeat R] [--legacy-ref REV] [--top N]
+"""
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Runs in the child interpreter; prints once the Text widget has been drawn.
+PAINT_SCRIPT = r"""
+import tkinter as tk
+import main
+root = main.ThemedTk() if hasattr(main, "ThemedTk") else tk.Tk()
+app = main.TextEditorApp(root)
+
+def painted(event):
+    if event.widget is app.text_widget:
+        root.unbind("<Expose>")
+        # the redraw itself is an idle callback queued by the expose
+        root.after_idle(lambda: (print("painted", flush=True), root.destroy()))
+
+root.bind("<Expose>", painted)
+root.mainloop()
+"""
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def first_commit():
+    return subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=HERE, check=True,
+                          stdout=subprocess.PIPE, text=True).stdout.split()[0]
+
+
+def legacy_tree(ref):
+    # A directory holding main.py as of ref; the other modules still come from
+    # the working tree, as they were added later.
+    folder = tempfile.mkdtemp(prefix="ela-startup-")
+    source = subprocess.run(["git", "show", f"{ref}:main.py"], cwd=HERE, check=True,
+                            stdout=subprocess.PIPE, text=True).stdout
+    with open(os.path.join(folder, "main.py"), "w", encoding="utf-8") as f:
+        f.write(source)
+    return folder
+
+
+def child_env(folder):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([folder, HERE] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    return env
+
+
+def time_import(folder):
+    # (seconds, {module: cumulative ms}) for the top-level imports of main.
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=folder,
+                            env=child_env(folder), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, check=True)
+    seconds = time.perf_counter() - start
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match and len(match.group(3)) <= 3:  # main and what it imports directly
+            modules[match.group(4)] = int(match.group(2)) / 1000
+    return seconds, modules
+
+
+def time_first_paint(folder):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", PAINT_SCRIPT], cwd=folder, env=child_env(folder),
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    line = process.stdout.readline()
+    seconds = time.perf_counter() - start
+    process.wait()
+    return seconds if line.startswith("painted") else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark text editor startup before/after lazy imports.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--legacy-ref", default=None, help="git revision holding the old main.py")
+    parser.add_argument("--top", type=int, default=8, help="number of slowest imports to list")
+    args = parser.parse_args(argv)
+
+    legacy = legacy_tree(args.legacy_ref or first_commit())
+    trees = {"before": legacy, "after": HERE}
+    has_display = bool(os.environ.get("DISPLAY")) or sys.platform in ("win32", "darwin")
+    results = {}
+    try:
+        for _ in range(args.repeat):
+            for label, folder in trees.items():
+                seconds, modules = time_import(folder)
+                best = results.setdefault(label, {"import": seconds, "modules": modules, "paint": None})
+                if seconds <= best["import"]:
+                    best["import"], best["modules"] = seconds, modules
+                if has_display:
+                    paint = time_first_paint(folder)
+                    if paint is not None and (best["paint"] is None or paint < best["paint"]):
+                        best["paint"] = paint
+    finally:
+        shutil.rmtree(legacy, ignore_errors=True)
+
+    print(f"best of {args.repeat}")
+    for label in trees:
+        best = results[label]
+        paint = f"{best['paint'] * 1000:7.1f} ms" if best["paint"] is not None else "    n/a (no display)"
+        print(f"{label:>6}: import {best['import'] * 1000:7.1f} ms, first paint {paint}")
+        slowest = sorted(best["modules"].items(), key=lambda item: -item[1])[:args.top]
+        for module, ms in slowest:
+            print(f"{'':>10}{ms:8.1f} ms  {module}")
+    print(f"import speedup: {results['before']['import'] / results['after']['import']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Build manifest for incremental course rebuilds.
+
+The manifest lives in the course root and maps every generated file (relative
+to the root) to a hash of the inputs it was rendered from: the writer
+arguments, the template set and MANIFEST_VERSION. A writer asks is_fresh()
+before rendering and skips the file when nothing changed, so unchanged pages
+are neither rewritten nor touched.
+"""
+import hashlib
+import json
+import os
+
+from templates import fingerprint, write_file
+
+MANIFEST_NAME = ".build-manifest.json"
+
+# Bump when the writers change output without a template change.
+MANIFEST_VERSION = 1
+
+
+class BuildManifest:
+    def __init__(self, course_dir):
+        self.course_dir = course_dir
+        self.path = os.path.join(course_dir, MANIFEST_NAME)
+        self.entries = {}
+        # Entries recorded since load(); worker processes hand these back.
+        self.updates = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable manifest: everything gets rebuilt.
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("outputs", {})
+
+    def key(self, fileName):
+        return os.path.relpath(fileName, self.course_dir).replace(os.sep, "/")
+
+    def digest(self, *inputs):
+        payload = json.dumps([MANIFEST_VERSION, fingerprint(), inputs], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_fresh(self, fileName, digest):
+        return self.entries.get(self.key(fileName)) == digest and os.path.exists(fileName)
+
+    def record(self, fileName, digest):
+        key = self.key(fileName)
+        self.entries[key] = digest
+        self.updates[key] = digest
+
+    def merge(self, updates):
+        self.entries.update(updates)
+        self.updates.update(updates)
+
+    def save(self, path=None):
+        # path lets a staged build write the manifest into its staging tree,
+        # which is already published with a rename.
+        data = json.dumps({"version": MANIFEST_VERSION, "outputs": dict(sorted(self.entries.items()))}, indent=1)
+        if path is not None and path != self.path:
+            write_file(path, data)
+            return
+        tmp_path = self.path + ".tmp"
+        write_file(tmp_path, data)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,234 @@
+"""
+Headless course compiler.
+
+Builds the same output as the Creator wizard (index.html, AUTH/, the module
+slides and their celebration pages, schema.sql and seed.sql) from a JSON
+course spec, with the wizard's writers (course_writer.py) but without any
+window: tkinter does not even have to be installed. Modules are written in parallel by a process pool, and pages whose
+inputs are unchanged since the last build are skipped (see build_manifest.py).
+With --atomic every course is staged next to its folder and published with
+renames only after all of its modules were written (see staging.py). Slide
+media is stored under content-hash names and shared between courses through
+hard links (see assets.py), and photos get downscaled WebP/AVIF variants that
+the slides offer through srcset (see images.py). When a vendor cache exists
+(~/.ela/vendor or --vendor-cache), the pages link local copies of their CSS/JS
+instead of the CDN (see vendor.py).
+
+Usage:
+    python course_builder.py course.json [more.json ...] [--jobs N] [--output-root DIR] [--atomic]
+                    [--shared-assets DIR] [--vendor-cache DIR]
+
+Spec format:
+    {
+        "title": "Python Basics",
+        "duration": "3",
+        "author": "Jane Doe",
+        "overview": "What the course is about",
+        "modules": [
+            {"slides": [
+                {"header": "Intro", "media": "intro.mp4", "paragraph": "...",
+                 "question": "2 + 2 = ?", "options": ["3", "4", "5", "6"], "answer": "4"}
+            ]}
+        ]
+    }
+
+The course.json the wizard saves in a course folder is a valid spec too.
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import images
+from assets import SHARED_STORE, AssetStore
+from build_manifest import BuildManifest
+from course_model import Course, Slide
+from course_writer import CourseWriter
+from staging import StagedBuild
+from vendor import VENDOR_CACHE, load_vendor
+
+SLIDE_FIELDS = list(Slide.__slots__)
+
+
+def load_spec(path):
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+
+    for key in ("title", "duration", "author", "overview", "modules"):
+        if key not in spec:
+            raise ValueError(f"{path}: missing '{key}'")
+    spec["modules"] = [{"slides": [normalize_slide(slide) for slide in module["slides"]]}
+                       for module in spec["modules"]]
+    return Course.from_dict(spec)
+
+
+def normalize_slide(raw):
+    # Accepts either the Creator field names (mediaFileUrl, optA..optD) or the
+    # shorter spec names (media, options).
+    slide = dict.fromkeys(SLIDE_FIELDS, "")
+    if "media" in raw:
+        slide["mediaFileUrl"] = raw["media"]
+    for letter, option in zip("ABCD", raw.get("options", [])):
+        slide[f"opt{letter}"] = option
+    for key in SLIDE_FIELDS:
+        if key in raw:
+            slide[key] = raw[key]
+    for key in SLIDE_FIELDS:
+        slide[key] = str(slide[key])
+    # the wizard strips the paragraph only (see Creator.save_and_next)
+    slide["paragraph"] = slide["paragraph"].strip()
+    return slide
+
+
+def check_titles(specs):
+    # Every course is built in a folder named after its upper-cased title, so
+    # two specs with the same title would write over each other.
+    seen = {}
+    for spec in specs:
+        folder = spec.title.upper()
+        if folder in seen:
+            raise ValueError(f"courses {seen[folder]!r} and {spec.title!r} would both be built in {folder}/")
+        seen[folder] = spec.title
+
+
+def headless_creator(file_dir, title, stage_dir=None, shared_assets=SHARED_STORE, vendor_cache=None):
+    creator = CourseWriter()
+    creator.file_dir = file_dir
+    creator.courseTitle = title
+    creator.manifest = BuildManifest(file_dir)
+    creator.assets = AssetStore(os.path.join(file_dir, "ASSETS"), shared_assets)
+    creator.vendor = load_vendor(vendor_cache)
+    if stage_dir is not None:
+        creator.staging = StagedBuild(file_dir, stage_dir)
+    return creator
+
+
+def _resolve_module(job):
+    # First pass, in a worker: stores the module's media under content-hash
+    # names and lists the photos the image stage has to encode.
+    creator = headless_creator(job["file_dir"], job["title"], None, job["shared_assets"])
+    slides = creator.resolve_media(job["slides"])
+    return slides, creator.photo_assets(slides)
+
+
+def _write_module(job):
+    # Runs in a worker process, so it only receives picklable arguments and
+    # hands its manifest entries back instead of saving the manifest itself.
+    creator = headless_creator(job["file_dir"], job["title"], job["stage_dir"], job["shared_assets"],
+                               job["vendor_cache"])
+    creator.image_variants = job.get("image_variants", {})
+    written = creator.write_module(job["module"], job["slides"], job["first_slide"])
+    return job["file_dir"], job["module"], len(job["slides"]), written, creator.manifest.updates
+
+
+def prepare_course(course, root=None, atomic=False, shared_assets=SHARED_STORE, vendor_cache=None):
+    # Writes the course-level files; returns the course's CourseWriter (holding
+    # its manifest and staging area) and one job per module.
+    modules = course.modules
+    folders = CourseWriter()
+    folders.directory(course.title, len(modules), root)  # creates the folders, sets file_dir
+    stage_dir = StagedBuild(folders.file_dir).stage_dir if atomic else None
+    creator = headless_creator(folders.file_dir, course.title, stage_dir, shared_assets, vendor_cache)
+    creator.course = course
+    creator.install_vendor()
+    creator.writeFile(f"{creator.file_dir}/index.html", course.title, course.duration,
+                      course.author, len(modules), course.overview)
+    creator.handler(f"{creator.file_dir}/AUTH/")
+    creator.write_scripts()
+
+    jobs = []
+    for number, module in enumerate(modules, start=1):
+        if module.slides:
+            jobs.append({"file_dir": creator.file_dir, "stage_dir": stage_dir, "title": course.title,
+                         "shared_assets": shared_assets, "vendor_cache": vendor_cache,
+                         "module": number, "slides": module.slides,
+                         "first_slide": course.first_slide(number)})
+    return creator, jobs
+
+
+def build_courses(specs, root=None, jobs=None, atomic=False, shared_assets=SHARED_STORE,
+                  vendor_cache=VENDOR_CACHE):
+    # specs are course_model.Course objects (see load_spec)
+    check_titles(specs)
+    courses = {}
+    module_jobs = []
+    try:
+        for spec in specs:
+            creator, course_jobs = prepare_course(spec, root, atomic, shared_assets, vendor_cache)
+            courses[creator.file_dir] = creator
+            module_jobs.extend(course_jobs)
+
+        pool = None if jobs == 1 else ProcessPoolExecutor(max_workers=jobs)
+        run = map if pool is None else pool.map
+        try:
+            # media first, then every photo of every course in one image
+            # stage, then the slides, which need to know the variants
+            resolved = list(run(_resolve_module, module_jobs))
+            photos = [path for slides, paths in resolved for path in paths]
+            # into each course's staging tree, if it has one
+            output_dirs = {path: os.path.dirname(courses[job["file_dir"]].output_path(path))
+                           for job, (slides, paths) in zip(module_jobs, resolved) for path in paths}
+            variants = images.optimize_images(photos, jobs, pool, output_dirs)
+            for job, (slides, paths) in zip(module_jobs, resolved):
+                job["slides"] = slides
+                # course.json keeps the stored names, so it rebuilds as is
+                courses[job["file_dir"]].course.modules[job["module"] - 1].slides = slides
+                job["image_variants"] = {os.path.basename(path): variants[path]
+                                         for path in paths if path in variants}
+            results = list(run(_write_module, module_jobs))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    except BaseException:
+        for creator in courses.values():
+            if creator.staging is not None:
+                creator.staging.abort()
+        raise
+
+    for file_dir, module, count, written, updates in results:
+        courses[file_dir].manifest.merge(updates)
+    for creator in courses.values():
+        creator.write_database()
+        creator.save_course()
+        creator.save_manifest()
+        if creator.staging is not None:
+            creator.staging.commit()
+    return [result[:4] for result in results]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build ELA courses from JSON specs without the GUI.")
+    parser.add_argument("specs", nargs="+", help="course spec files (.json)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes for module output and image encoding (default: CPU count)")
+    parser.add_argument("-o", "--output-root", default=None,
+                        help="directory the course folders are created in (default: home)")
+    parser.add_argument("--atomic", action="store_true",
+                        help="stage each course and publish it only once it is complete")
+    parser.add_argument("--shared-assets", default=SHARED_STORE,
+                        help="store that identical media is hard-linked from (default: %(default)s)")
+    parser.add_argument("--vendor-cache", default=VENDOR_CACHE,
+                        help="folder of CSS/JS copies to link instead of the CDN, '' to keep the CDN "
+                             "(default: %(default)s, if it exists)")
+    args = parser.parse_args(argv)
+
+    try:
+        specs = [load_spec(path) for path in args.specs]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error reading course spec: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        results = build_courses(specs, args.output_root, args.jobs, args.atomic, args.shared_assets,
+                                args.vendor_cache)
+    except ValueError as e:
+        print(f"Error building courses: {e}", file=sys.stderr)
+        return 1
+    for file_dir, module, count, written in results:
+        print(f"{os.path.join(file_dir, f'module{module}')}: {count} slides, {written} rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
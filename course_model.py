@@ -0,0 +1,102 @@
+"""
+Widget-independent course data for the Creator pipeline.
+
+The wizard's editors fill a Course in, the page writers read from it, and
+it is saved as course.json in the course folder, so a course can be kept,
+diffed and rebuilt (python course_builder.py ~/TITLE/course.json) without
+any window open. The classes use __slots__ and hold plain strings only,
+which keeps a course of thousands of slides small in memory.
+
+course.json has the same layout as a course_builder.py spec:
+
+    {"title": ..., "duration": ..., "author": ..., "overview": ...,
+     "modules": [{"slides": [{"header": ..., "mediaFileUrl": ..., ...}]}]}
+"""
+import json
+
+COURSE_FILE = "course.json"
+
+
+class Slide:
+    __slots__ = ("header", "mediaFileUrl", "paragraph", "question",
+                 "optA", "optB", "optC", "optD", "answer")
+
+    def __init__(self, header="", mediaFileUrl="", paragraph="", question="",
+                 optA="", optB="", optC="", optD="", answer=""):
+        self.header = header
+        self.mediaFileUrl = mediaFileUrl
+        self.paragraph = paragraph
+        self.question = question
+        self.optA = optA
+        self.optB = optB
+        self.optC = optC
+        self.optD = optD
+        self.answer = answer
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{key: str(data[key]) for key in cls.__slots__ if key in data})
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def replace(self, **changes):
+        data = self.to_dict()
+        data.update(changes)
+        return Slide(**data)
+
+    def __eq__(self, other):
+        if not isinstance(other, Slide):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __repr__(self):
+        return f"Slide(header={self.header!r}, mediaFileUrl={self.mediaFileUrl!r})"
+
+
+class Module:
+    __slots__ = ("slides",)
+
+    def __init__(self, slides=None):
+        self.slides = list(slides) if slides else []
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(Slide.from_dict(slide) for slide in data.get("slides", []))
+
+    def to_dict(self):
+        return {"slides": [slide.to_dict() for slide in self.slides]}
+
+    def __len__(self):
+        return len(self.slides)
+
+
+class Course:
+    __slots__ = ("title", "duration", "author", "overview", "modules")
+
+    def __init__(self, title="", duration="", author="", overview="", modules=None):
+        self.title = title
+        self.duration = duration
+        self.author = author
+        self.overview = overview
+        self.modules = list(modules) if modules else []
+
+    @classmethod
+    def from_dict(cls, data):
+        for key in ("title", "duration", "author", "overview", "modules"):
+            if key not in data:
+                raise ValueError(f"course is missing '{key}'")
+        return cls(str(data["title"]), str(data["duration"]), str(data["author"]), str(data["overview"]),
+                   [Module.from_dict(module) for module in data["modules"]])
+
+    def to_dict(self):
+        return {"title": self.title, "duration": self.duration, "author": self.author,
+                "overview": self.overview, "modules": [module.to_dict() for module in self.modules]}
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=1, ensure_ascii=False)
+
+    def first_slide(self, number):
+        # Slides are numbered across the course; this is the count before
+        # module `number` (1-based).
+        return sum(len(module) for module in self.modules[:number - 1])
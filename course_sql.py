@@ -0,0 +1,62 @@
+"""
+Database scripts for a built course.
+
+AUTH/handler.php tracks progress in the Courses, Modules, Slides,
+UserSlideProgress and UserProgress tables, but nothing used to create them
+or the rows for the slides a course has. Every build now writes two files
+into the course folder:
+
+- schema.sql creates the tables (only where missing), with keys matching the
+  WHERE clauses of handler.php, so none of its lookups scans a table;
+- seed.sql inserts or updates the course, its modules and its slides with a
+  few multi-row statements, and removes the ones a rebuild dropped.
+
+Modules are seeded as "Module N" and slides under their file names, which is
+what every slide posts to handler.php (see CourseWriter.render_slide). Neither
+file is part of the exported course package (see export.py).
+"""
+from templates import render
+
+SCHEMA_FILE = "schema.sql"
+SEED_FILE = "seed.sql"
+
+# rows per INSERT statement, well under MySQL's default max_allowed_packet
+SEED_BATCH = 1000
+
+
+def sql_string(value):
+    # MySQL string literal; backslashes escape in the default sql_mode
+    value = str(value).replace("\\", "\\\\").replace("'", "''").replace("\0", "\\0")
+    return f"'{value}'"
+
+
+def module_title(module):
+    return f"Module {module}"
+
+
+def slide_name(module, index):
+    return f"module_{module}_slide_{index}.html"
+
+
+def seed_rows(course):
+    # (ModuleTitle, SlideName, SlideIndex) literals of every slide
+    for number, module in enumerate(course.modules, start=1):
+        title = sql_string(module_title(number))
+        if not module.slides:
+            yield f"({title}, NULL, NULL)"
+        for index in range(1, len(module.slides) + 1):
+            yield f"({title}, {sql_string(slide_name(number, index))}, {index})"
+
+
+def seed_sql(course):
+    rows = list(seed_rows(course))
+    inserts = []
+    for start in range(0, len(rows), SEED_BATCH):
+        inserts.append("INSERT INTO SeedSlides (ModuleTitle, SlideName, SlideIndex) VALUES\n    "
+                       + ",\n    ".join(rows[start:start + SEED_BATCH]) + ";")
+    return render("sql/seed.sql", title=sql_string(course.title),
+                  seed_rows="\n".join(inserts) or "-- (the course has no modules)")
+
+
+def schema_sql():
+    return render("sql/schema.sql")
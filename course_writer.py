@@ -0,0 +1,295 @@
+"""
+Course page writers.
+
+CourseWriter turns a course into its folder (~/TITLE/): the index page,
+AUTH/, the module slides and celebration pages, the shared quiz script and
+the database scripts. It holds no widgets and does not import tkinter, so the
+headless builder (course_builder.py) runs on a machine without Tk; the
+Creator wizard (dummy.py) is a CourseWriter with the windows on top.
+"""
+import contextlib
+import json
+import os
+
+import images
+import media
+from course_model import COURSE_FILE
+from course_sql import SCHEMA_FILE, SEED_FILE, module_title, schema_sql, seed_sql
+from staging import StagedBuild
+from templates import get_template, render, versioned_name, write_file
+
+MEDIA_TEMPLATES = {
+    media.DOCUMENT: "slide/media_document.html",
+    media.PHOTO: "slide/media_photo.html",
+    media.AUDIO: "slide/media_player.html",
+    media.VIDEO: "slide/media_player.html",
+}
+
+# Quiz and progress logic shared by all slides, see write_scripts()
+QUIZ_SCRIPT = "js/quiz.js"
+
+
+class CourseWriter:
+    def __init__(self):
+        self.file_dir = ''
+        self.courseTitle =''
+        # BuildManifest of the course being written; None writes everything
+        self.manifest = None
+        # StagedBuild collecting the current step's output; None writes in place
+        self.staging = None
+        # AssetStore that renames slide media to content hashes; None keeps names
+        self.assets = None
+        # asset name -> responsive variants of that photo (see images.py)
+        self.image_variants = {}
+        # Course being written (see course_model.py); saved as course.json
+        self.course = None
+        # Vendor whose local CSS/JS copies replace the CDN links; None links the CDN
+        self.vendor = None
+
+    def directory(self,parent,child,root=None):
+        home_directory = root or os.path.expanduser("~")
+        parent = parent.upper()
+        self.file_dir = os.path.join(home_directory, parent)
+        file_directory = os.path.join(home_directory, parent)
+        os.makedirs(self.file_dir, exist_ok=True)
+        os.makedirs(file_directory, exist_ok=True)
+        os.makedirs(os.path.join(file_directory,f"ASSETS"),exist_ok = True)
+        os.makedirs(os.path.join(file_directory,f"AUTH"),exist_ok = True)
+        
+        for i in range(1,child+1):
+            os.makedirs(os.path.join(file_directory,f"module{i}"),exist_ok = True)
+
+    def write_module(self, module, slides, first_slide=0):
+         # Writes every slide of one module plus its celebration page.
+         # Slide numbers continue from first_slide, so modules can be written
+         # in any order (or in parallel) once the offsets are known.
+         # Returns how many slides were actually rewritten.
+         written = 0
+         for i, slide in enumerate(slides):
+             if i == len(slides)-1:
+                nextSlideName = f"celebration.html"
+                self.celebration(f"{self.file_dir}/module{module}/")
+             else:
+                nextSlideName = f"module_{module}_slide_{i + 2}.html"
+    
+             if i >= 1 :
+                 previousslide = f"module_{module}_slide_{i}.html"
+    
+             else:    
+                 previousslide = ''
+    
+             written += self.writeFileSlide(
+                 f"{self.file_dir}/module{module}/module_{module}_slide_{i + 1}.html",
+                 f"module_{module}_slide_{i + 1}.html",
+                 slide.header,
+                 slide.mediaFileUrl,
+                 slide.paragraph,
+                 slide.question,
+                 slide.optA,
+                 slide.optB,
+                 slide.optC,
+                 slide.optD,
+                 slide.answer,
+                 nextSlideName,
+                 previousslide,
+                 module,
+                 first_slide + i + 1  # slide number
+             )
+         return written
+
+    def resolve_media(self, slides):
+        # Returns the slides with their media stored under content-hash names.
+        if self.assets is None:
+            return slides
+        return [slide.replace(mediaFileUrl=self.assets.resolve(slide.mediaFileUrl)) for slide in slides]
+
+    def photo_assets(self, slides):
+        # Paths of the local photos among the (resolved) slide media.
+        assets_dir = os.path.join(self.file_dir, "ASSETS")
+        paths = []
+        for slide in slides:
+            mediaFileUrl = slide.mediaFileUrl
+            if media.classify(mediaFileUrl, assets_dir) == media.PHOTO:
+                path = os.path.join(assets_dir, mediaFileUrl)
+                if os.path.isfile(path):
+                    paths.append(path)
+        return paths
+
+    def optimize_images(self, slides, jobs=None, executor=None):
+        # Encodes the downscaled variants of every photo in slides (in a
+        # process pool) so the slides can offer them through srcset.
+        paths = self.photo_assets(slides)
+        output_dirs = {path: os.path.dirname(self.output_path(path)) for path in paths}
+        for path, variants in images.optimize_images(paths, jobs, executor, output_dirs).items():
+            self.image_variants[os.path.basename(path)] = variants
+
+    def emit(self, fileName, inputs, render_page, mode="w"):
+        # Writes render_page() to fileName unless the manifest says the file
+        # was already built from the same inputs; returns True if written.
+        if self.vendor is not None and fileName.endswith(".html"):
+            inputs = inputs + (self.vendor.fingerprint,)
+            render_linked = render_page
+            render_page = lambda: self.vendor.rewrite(render_linked(), self.assets_prefix(fileName))
+        digest = None
+        if self.manifest is not None:
+            digest = self.manifest.digest(*inputs)
+            if self.manifest.is_fresh(fileName, digest):
+                return False
+        write_file(self.output_path(fileName, mode), render_page(), mode)
+        if digest is not None:
+            self.manifest.record(fileName, digest)
+        return True
+
+    def assets_prefix(self, fileName):
+        # Relative path from fileName's folder to the course's ASSETS/.
+        assets_dir = os.path.join(self.file_dir, "ASSETS")
+        return os.path.relpath(assets_dir, os.path.dirname(os.path.abspath(fileName))).replace(os.sep, "/") + "/"
+
+    def install_vendor(self):
+        if self.vendor is not None:
+            self.vendor.install(os.path.join(self.file_dir, "ASSETS", "vendor"), self.output_path)
+
+    def output_path(self, fileName, mode="w"):
+        # Redirects writes into the staging tree while a staged build is running.
+        if self.staging is None:
+            return fileName
+        return self.staging.path(fileName, mode)
+
+    @contextlib.contextmanager
+    def staged_build(self):
+        # Everything written inside the with-block goes live as one commit
+        # (see staging.py) when it exits cleanly, and is thrown away if it raises.
+        self.staging = StagedBuild(self.file_dir)
+        try:
+            with self.staging:
+                yield self.staging
+        finally:
+            self.staging = None
+
+    def save_course(self):
+        if self.course is not None:
+            write_file(self.output_path(os.path.join(self.file_dir, COURSE_FILE)), self.course.to_json())
+
+    def write_database(self):
+        # schema.sql and seed.sql for handler.php's tables, see course_sql.py
+        self.emit(f"{self.file_dir}/{SCHEMA_FILE}", (), schema_sql)
+        self.emit(f"{self.file_dir}/{SEED_FILE}", (self.course.title, [len(module) for module in self.course.modules]),
+                  lambda: seed_sql(self.course))
+
+    def save_manifest(self):
+        if self.manifest is not None:
+            self.manifest.save(self.output_path(self.manifest.path))
+
+    def writeFile(self, fileName, title, duration, author, modules, overview):
+        self.emit(f"{self.file_dir}/README.md", (author, modules, overview),
+                  lambda: render("index/readme.md", author=author, modules=modules, overview=overview), "a")
+        self.emit(fileName, (title, duration, author, modules, overview, self.file_dir),
+                  lambda: self.render_index(title, duration, author, modules, overview))
+
+    def render_index(self, title, duration, author, modules, overview):
+        module_template = get_template("index/module.html")
+        modules_block = "".join(module_template.render(file_dir=self.file_dir, module=module)
+                                for module in range(1,modules+1))
+        return render("index/page.html",
+                      title=title,
+                      duration=duration,
+                      author=author,
+                      overview=overview,
+                      file_dir=self.file_dir,
+                      modules_block=modules_block)
+
+    def writeFileSlide(self, fileName,slide_name, header, mediaFileUrl, paragraph, question, optA, optB, optC, optD, answer,nextSlideName,previousslide,moduleID,slideID):
+        if self.assets is not None:
+            mediaFileUrl = self.assets.resolve(mediaFileUrl)
+        # the media kind may come from sniffing the asset, so it is an input too
+        media_kind = media.classify(mediaFileUrl, os.path.join(self.file_dir, "ASSETS"))
+        image_variants = self.image_variants.get(mediaFileUrl) if media_kind == media.PHOTO else None
+        args = (slide_name, header, mediaFileUrl, paragraph, question, optA, optB, optC, optD, answer,
+                nextSlideName, previousslide, moduleID, slideID, media_kind, image_variants)
+        return self.emit(fileName, args + (self.courseTitle,), lambda: self.render_slide(*args))
+
+    def render_slide(self, slide_name, header, mediaFileUrl, paragraph, question, optA, optB, optC, optD, answer,nextSlideName,previousslide,moduleID,slideID,media_kind,image_variants=None):
+        previous_block = render("slide/previous.html", previousslide=previousslide) if previousslide else ''
+
+        header_block = render("slide/header.html", header=header) if header else ''
+
+        #media type logic (see media.py); unknown kinds are embedded as external pages
+        media_block = ''
+        if image_variants:
+             media_block = self.render_picture(mediaFileUrl, image_variants)
+        elif mediaFileUrl:
+             media_template = MEDIA_TEMPLATES.get(media_kind, "slide/media_external.html")
+             media_block = render(media_template, mediaFileUrl=mediaFileUrl)
+
+        paragraph_block = render("slide/paragraph.html", paragraph=paragraph) if paragraph else ''
+
+        # everything the shared quiz script needs to know about this slide
+        slide_data = {
+            "title": self.courseTitle,
+            # the Modules row seeded by course_sql.py, which getIds() matches
+            "moduleTitle": module_title(moduleID),
+            "slideName": slide_name,
+            "nextSlideName": nextSlideName,
+        }
+
+        #if no question, continue button to be deployed 
+        nav_block = ''
+        question_block = ''
+        if not question:
+              nav_block = previous_block + render("slide/continue.html", nextSlideName=nextSlideName)
+        else:
+             #if there four MCQ
+             if optA and optB and optC and optD:
+                   options_template = "slide/options_choice.html"
+             #if its one word answer 
+             elif not optA and not optB and not optC and  not optD:
+                   options_template = "slide/options_text.html"
+             #if boolean
+             else:
+                   options_template = "slide/options_boolean.html"
+             options_block = render(options_template, optA=optA, optB=optB, optC=optC, optD=optD,
+                                    previous_block=previous_block)
+             question_block = render("slide/question.html", question=question, options_block=options_block)
+
+             #answers verification mode for the quiz script
+             slide_data["answerMode"] = "choice" if optA and optB else "text"
+             slide_data["correctAnswer"] = answer
+
+        return render("slide/page.html",
+                      header=header,
+                      header_block=header_block,
+                      media_block=media_block,
+                      paragraph_block=paragraph_block,
+                      nav_block=nav_block,
+                      question_block=question_block,
+                      slide_data=json.dumps(slide_data, ensure_ascii=False).replace("</", "<\\/"),
+                      quiz_script=versioned_name(QUIZ_SCRIPT))
+
+    def write_scripts(self):
+        # One copy of the quiz script per course, under a content-hashed name.
+        os.makedirs(f"{self.file_dir}/ASSETS/js", exist_ok=True)
+        self.emit(f"{self.file_dir}/ASSETS/{versioned_name(QUIZ_SCRIPT)}", (), lambda: render(QUIZ_SCRIPT))
+
+    def render_picture(self, mediaFileUrl, image_variants):
+        # One <source> per encoded format, best compression first; the
+        # original upload stays the <img> fallback.
+        source_template = get_template("slide/picture_source.html")
+        sources = "".join(source_template.render(mime_type=images.MIME_TYPES[fmt],
+                                                 srcset=images.srcset(image_variants, fmt, "../ASSETS/"),
+                                                 sizes=images.SIZES)
+                          for fmt in images.FORMATS if any(variant[0] == fmt for variant in image_variants))
+        return render("slide/media_picture.html", sources=sources, mediaFileUrl=mediaFileUrl)
+
+    #The  connection  with database
+    def handler(self,file_Directory):
+        #config.php database connection        
+        self.emit(file_Directory +'config.php', (), lambda: render("auth/config.php"))
+        #handler.php database connection        
+        self.emit(file_Directory +'handler.php', (), lambda: render("auth/handler.php"))
+        #handler.js connection  receiver
+        self.emit(file_Directory +'handler.js', (), lambda: render("auth/handler.js"))
+
+        #celebration 
+    def celebration(self,file_Directory):
+              self.emit(file_Directory +'celebration.html', (self.file_dir,),
+                        lambda: render("celebration.html", file_dir=self.file_dir))
@@ -0,0 +1,179 @@
+"""
+Crash-safe draft journal for form windows.
+
+A DraftJournal keeps a form's field values in an append-only JSON-lines file
+(~/.ela/drafts/<name>.jsonl). Every line is one of
+
+    {"snapshot": {field: value, ...}}   the full state
+    {"changes": {field: value, ...}}    only the fields that changed since
+
+and replaying the lines in order gives the latest state, so restoring a form
+after a crash is one small file read. A line that was cut off by the crash is
+ignored, and the next write replaces the journal with a clean snapshot.
+
+record() is called from the Tk thread on every edit and only queues the
+change. A background thread coalesces the changes that arrive within the
+debounce delay into one appended line (flushed and fsynced), so typing never
+waits on the disk. The timing comes from an injectable clock; a journal made
+with background=False has no thread and is written by calling flush(). After COMPACT_EVERY appended lines the journal is
+rewritten as a single snapshot, through a temporary file and a rename.
+"""
+import json
+import os
+import threading
+import time
+
+DRAFT_DIR = os.path.join(os.path.expanduser("~"), ".ela", "drafts")
+
+DEBOUNCE = 0.5
+# upper bound on how long a burst of typing can keep its changes unwritten
+MAX_DELAY = 2.0
+COMPACT_EVERY = 200
+
+
+def draft_path(name):
+    return os.path.join(DRAFT_DIR, f"{name}.jsonl")
+
+
+class DraftJournal:
+    def __init__(self, path, debounce=DEBOUNCE, compact_every=COMPACT_EVERY, max_delay=MAX_DELAY,
+                 clock=time.monotonic, background=True):
+        self.path = path
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.compact_every = compact_every
+        self.clock = clock
+        self.background = background
+        # last value per field as the Tk thread saw it, to drop no-op edits
+        self.seen = {}
+        # state written to disk so far (writer thread only)
+        self.state = {}
+        self.lines = 0
+        self.pending = {}
+        # clock times of the latest queued edit and by when the oldest
+        # pending one has to be written
+        self.last_edit = 0.0
+        self.deadline = None
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def load(self):
+        # Replays the journal; returns the latest field values ({} if none).
+        state = {}
+        lines = 0
+        torn = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        torn = True  # cut off by a crash
+                        break
+                    if "snapshot" in entry:
+                        state = dict(entry["snapshot"])
+                    else:
+                        state.update(entry.get("changes", {}))
+                    lines += 1
+        except OSError:
+            pass
+        self.state = dict(state)
+        self.seen = dict(state)
+        # a torn line must not get the next change appended to it, so the
+        # first write after one rewrites the journal
+        self.lines = self.compact_every if torn else lines
+        return state
+
+    def record(self, changes):
+        # Queues the fields whose value differs from the last recorded one.
+        changes = {field: value for field, value in changes.items() if self.seen.get(field) != value}
+        if not changes:
+            return
+        self.seen.update(changes)
+        with self.condition:
+            now = self.clock()
+            if not self.pending:
+                self.deadline = now + self.max_delay
+            self.last_edit = now
+            self.pending.update(changes)
+            if self.background and self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="draft-journal", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending and self.closed:
+                    return
+                # record() wakes the wait early, so the due time is
+                # recomputed each time
+                while not self.closed:
+                    delay = self.due() - self.clock()
+                    if delay <= 0:
+                        break
+                    self.condition.wait(delay)
+            self.flush()
+
+    def due(self):
+        # When the pending changes have to be written: once the burst has
+        # settled for the debounce delay, but not past the deadline.
+        return min(self.last_edit + self.debounce, self.deadline)
+
+    def flush(self, force=False):
+        # Appends the pending changes if they are due (any pending ones with
+        # force, or once closed); returns True if a line was written.
+        with self.condition:
+            if not self.pending or not (force or self.closed or self.clock() >= self.due()):
+                return False
+            changes, self.pending = self.pending, {}
+            self.deadline = None
+        self.append(changes)
+        return True
+
+    def append(self, changes):
+        self.state.update(changes)
+        if self.lines + 1 >= self.compact_every:
+            self.compact()
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"changes": changes}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.lines += 1
+
+    def compact(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"snapshot": self.state}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.lines = 1
+
+    def close(self):
+        # Writes whatever is still queued and stops the writer thread.
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        else:
+            self.flush(force=True)
+
+    def clear(self):
+        # Drops the draft, e.g. once the form was saved for real.
+        self.close()
+        self.seen = {}
+        self.state = {}
+        self.lines = 0
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,193 @@
+"""
+Course package export.
+
+Streams a built course folder (~/TITLE/) into a single zip or tar archive, so
+deploying to the LMS is one upload instead of a sync of thousands of files.
+Files are read in chunks and written straight into the archive; nothing is
+copied to a temporary folder first. The archive ends with MANIFEST.json,
+listing the path, size and SHA-256 of every file in it.
+
+The build inputs (the build manifest and course.json), the database scripts
+(schema.sql, seed.sql), uploads already stored under a content-hash name (see
+assets.py) and leftover temporary files (.tmp, hidden names) are not
+exported. With --store-media, zip entries for already-compressed media
+(photos, audio, video, fonts, archives) are stored as-is instead of being
+deflated again, which is much faster and barely changes the archive size.
+
+Usage:
+    python export.py ~/TITLE course.zip [--store-media]
+    python export.py ~/TITLE course.tar.gz
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+
+from assets import STORED_NAME
+from build_manifest import MANIFEST_NAME
+from course_model import COURSE_FILE
+from course_sql import SCHEMA_FILE, SEED_FILE
+
+ARCHIVE_MANIFEST = "MANIFEST.json"
+
+CHUNK_SIZE = 1024 * 1024
+
+# Already compressed: deflating these again costs time and saves nothing.
+COMPRESSED_EXTENSIONS = frozenset(
+    "jpg jpeg png gif webp avif mp4 mov mkv m4v webm mp3 ogg m4a aac opus flac "
+    "woff woff2 zip gz bz2 xz 7z docx xlsx pptx odt ods".split())
+
+TAR_MODES = {".tar": "w|", ".tar.gz": "w|gz", ".tgz": "w|gz", ".tar.bz2": "w|bz2", ".tar.xz": "w|xz"}
+
+
+def stored_files(assets_dir):
+    # (device, inode) of every content-addressed file in ASSETS
+    try:
+        entries = list(os.scandir(assets_dir))
+    except FileNotFoundError:
+        return set()
+    return {(st.st_dev, st.st_ino) for st in (entry.stat() for entry in entries
+                                              if entry.is_file() and STORED_NAME.fullmatch(entry.name))}
+
+
+def course_files(course_dir):
+    # (archive name, path) of every file to export, in a stable order.
+    assets_dir = os.path.join(course_dir, "ASSETS")
+    stored = stored_files(assets_dir)
+    for folder, dirs, names in os.walk(course_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(names):
+            if name.startswith(".") or name.endswith(".tmp"):
+                continue
+            path = os.path.join(folder, name)
+            rel = os.path.relpath(path, course_dir).replace(os.sep, "/")
+            if rel in (MANIFEST_NAME, COURSE_FILE, SCHEMA_FILE, SEED_FILE):
+                continue
+            if folder == assets_dir and not STORED_NAME.fullmatch(name):
+                st = os.stat(path)
+                if (st.st_dev, st.st_ino) in stored:
+                    continue  # an upload the slides use under its hashed name
+            yield rel, path
+
+
+def archive_format(output):
+    lower = output.lower()
+    if lower.endswith(".zip"):
+        return "zip"
+    for suffix in TAR_MODES:
+        if lower.endswith(suffix):
+            return suffix
+    raise ValueError(f"{output}: unsupported archive type (use .zip, .tar, .tar.gz, .tgz, .tar.bz2 or .tar.xz)")
+
+
+class HashingReader:
+    # File wrapper that hashes and counts what tarfile reads through it.
+    def __init__(self, f):
+        self.f = f
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.digest.update(data)
+        self.size += len(data)
+        return data
+
+
+def export_course(course_dir, output, store_media=False):
+    # Writes the archive under a temporary name and renames it into place,
+    # so a failed export never leaves a truncated package behind.
+    # Returns the manifest entries.
+    kind = archive_format(output)
+    tmp_path = output + ".part"
+    try:
+        if kind == "zip":
+            files = write_zip(course_dir, tmp_path, store_media)
+        else:
+            files = write_tar(course_dir, tmp_path, TAR_MODES[kind])
+        os.replace(tmp_path, output)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return files
+
+
+def manifest_bytes(course_dir, files):
+    data = {"course": os.path.basename(os.path.normpath(course_dir)), "files": files}
+    return json.dumps(data, indent=1).encode("utf-8")
+
+
+def write_zip(course_dir, output, store_media=False):
+    files = []
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+        for name, path in course_files(course_dir):
+            info = zipfile.ZipInfo.from_file(path, name)
+            extension = os.path.splitext(name)[1][1:].lower()
+            if store_media and extension in COMPRESSED_EXTENSIONS:
+                info.compress_type = zipfile.ZIP_STORED
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+            digest = hashlib.sha256()
+            with open(path, "rb") as source, archive.open(info, "w") as dest:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    dest.write(chunk)
+            files.append({"path": name, "size": info.file_size, "sha256": digest.hexdigest()})
+        archive.writestr(ARCHIVE_MANIFEST, manifest_bytes(course_dir, files))
+    return files
+
+
+def write_tar(course_dir, output, mode):
+    # Stream modes ("w|gz") never seek, so the archive is written front to back.
+    files = []
+    with tarfile.open(output, mode) as archive:
+        for name, path in course_files(course_dir):
+            info = archive.gettarinfo(path, name)
+            if info.islnk():
+                # a second name for an exported inode: store the data again,
+                # the LMS unpacker need not support tar hard links
+                info.type = tarfile.REGTYPE
+                info.linkname = ""
+                info.size = os.path.getsize(path)
+            with open(path, "rb") as source:
+                reader = HashingReader(source)
+                archive.addfile(info, reader)
+            files.append({"path": name, "size": reader.size, "sha256": reader.digest.hexdigest()})
+        data = manifest_bytes(course_dir, files)
+        info = tarfile.TarInfo(ARCHIVE_MANIFEST)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        archive.addfile(info, io.BytesIO(data))
+    return files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a built ELA course folder as one archive.")
+    parser.add_argument("course_dir", help="course folder, e.g. ~/PYTHON BASICS")
+    parser.add_argument("output", help="archive to write (.zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz)")
+    parser.add_argument("--store-media", action="store_true",
+                        help="zip only: store already-compressed media without deflating it again")
+    args = parser.parse_args(argv)
+
+    course_dir = os.path.expanduser(args.course_dir)
+    if not os.path.isdir(course_dir):
+        print(f"Error: {course_dir} is not a folder", file=sys.stderr)
+        return 1
+    try:
+        files = export_course(course_dir, args.output, args.store_media)
+    except (OSError, ValueError) as e:
+        print(f"Error exporting course: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.output}: {len(files)} files, {sum(f['size'] for f in files)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
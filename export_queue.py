@@ -0,0 +1,164 @@
+"""
+Background exports for the text editor.
+
+The save commands used to serialize and write the document on the Tk thread,
+so a big PDF or Word export froze the window until it was done. An
+ExportQueue takes a DocumentSnapshot of the buffer on the Tk thread (one
+get() and one tag_ranges() per formatting tag) and runs the exporter on a
+small thread pool, so editing can go on while the file is written; later
+edits do not change an export that is already queued. Several exports can
+run at once (WORKERS at a time, the others wait their turn).
+
+Each export writes to a temporary file next to the target and renames it
+into place when it is done, so a cancelled or failed export never leaves a
+half-written file behind. The file keeps the permissions of the one it
+replaces, and a symlinked target is written through the link. The Tk thread
+polls the jobs with after() and shows their combined progress in the status
+bar (next to a file that is loading, if any), whose Cancel button stops every
+export that is still running or waiting. close() drops them all when the
+window goes away, so quitting never waits for a queued export.
+"""
+import concurrent.futures
+import os
+import stat
+import tempfile
+
+from exporters import FORMAT_TAGS, DocumentSnapshot, ExportCancelled
+
+WORKERS = 2
+# milliseconds between two progress updates
+POLL_DELAY = 100
+
+
+def current_umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# read once on import: os.umask() can only be queried by setting it, which
+# is not safe on the worker threads
+UMASK = current_umask()
+
+
+def target_mode(path):
+    # Saving over a file keeps its permissions (a private 0600 document stays
+    # private, a script stays executable); a new file gets what open() gives.
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~UMASK
+
+
+class ExportJob:
+    def __init__(self, export, snapshot, path):
+        self.export = export
+        self.snapshot = snapshot
+        self.path = path
+        self.done = 0
+        self.total = len(snapshot.text)
+        self.cancelled = False
+        self.future = None
+
+    def progress(self, done, total):
+        # Called by the exporter on the worker thread.
+        if self.cancelled:
+            raise ExportCancelled()
+        self.done, self.total = done, total
+
+    def run(self):
+        if self.cancelled:
+            raise ExportCancelled()
+        # a symlinked target is written through, not replaced by a file
+        path = os.path.realpath(self.path)
+        folder, name = os.path.split(path)
+        # unique, so two exports to the same file cannot mix their output
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".part", dir=folder)
+        os.close(fd)
+        try:
+            self.export(self.snapshot, tmp_path, self.progress)
+            os.chmod(tmp_path, target_mode(path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def cancel(self):
+        self.cancelled = True
+        self.future.cancel()  # only succeeds while it is still waiting
+
+    def error(self):
+        # None if the export succeeded, otherwise the exception.
+        if self.future.cancelled():
+            return ExportCancelled()
+        return self.future.exception()
+
+
+class ExportQueue:
+    def __init__(self, widget, status=None, on_done=None, workers=WORKERS):
+        self.widget = widget
+        self.status = status
+        self.on_done = on_done
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers,
+                                                              thread_name_prefix="export")
+        self.jobs = []
+        self.job = None
+
+    def submit(self, export, path, tags=FORMAT_TAGS):
+        # export(snapshot, path, progress) runs on a worker thread; tags are
+        # the formatting tags it needs (none for plain text).
+        snapshot = DocumentSnapshot.from_text_widget(self.widget, tags)
+        job = ExportJob(export, snapshot, path)
+        job.future = self.executor.submit(job.run)
+        self.jobs.append(job)
+        if self.status is not None:
+            self.status.start(self, self.message(), self.cancel)
+        if self.job is None:
+            self.job = self.widget.after(POLL_DELAY, self.poll)
+        return job
+
+    def message(self):
+        if len(self.jobs) == 1:
+            return f"Saving {os.path.basename(self.jobs[0].path)}..."
+        return f"Saving {len(self.jobs)} files..."
+
+    def poll(self):
+        self.job = None
+        finished = [job for job in self.jobs if job.future.done()]
+        for job in finished:
+            self.jobs.remove(job)
+        message = None
+        for job in finished:
+            name = os.path.basename(job.path)
+            error = job.error()
+            if error is None:
+                message = f"Saved {name}"
+            elif isinstance(error, ExportCancelled):
+                message = f"Stopped saving {name}"
+            else:
+                message = f"Error saving {name}: {error}"
+        if self.status is not None:
+            if self.jobs:
+                self.status.progress(self, sum(job.done for job in self.jobs), sum(job.total for job in self.jobs),
+                                     self.message())
+            elif finished:
+                self.status.finish(self, message)
+        if self.jobs:
+            self.job = self.widget.after(POLL_DELAY, self.poll)
+        if self.on_done is not None:
+            for job in finished:
+                self.on_done(job, job.error())
+
+    def cancel(self):
+        for job in self.jobs:
+            job.cancel()
+
+    def close(self):
+        # The window is closing: waiting exports are dropped and a running one
+        # stops at its next progress report, so exit does not wait for them.
+        self.cancel()
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,310 @@
+"""
+Document export for the text editor.
+
+A DocumentSnapshot is an immutable copy of the editor buffer: its text plus
+the bold/italic/underline tag ranges as character offsets. It is taken on
+the Tk thread in one go (one get() and one tag_ranges() per tag), after
+which the exporters no longer need the widget.
+
+iter_runs() turns the tag ranges into formatting runs with a single sweep
+over their sorted boundaries, so the cost does not depend on how the tags
+are spread over the text.
+
+export_pdf() lays the runs out with reportlab: words are measured with
+cached string widths, lines wrap at the page margins and pages break at the
+bottom margin. Each page is finished with showPage() as soon as it is full,
+so the working set is one page of layout. reportlab still keeps finished
+page streams until save(); they are compressed (pageCompression), which
+keeps a 100,000-line document in a few MB.
+
+export_docx() writes one Word paragraph per line and one run per formatting
+run, building the python-docx document in a single pass. export_text() is
+the plain text save.
+
+All exporters take (snapshot, path, progress=None), which is what
+export_queue.ExportQueue runs them with.
+"""
+import functools
+import locale
+import re
+
+FORMAT_TAGS = ("bold", "italic", "underline")
+
+
+class DocumentSnapshot:
+    __slots__ = ("text", "ranges")
+
+    def __init__(self, text, ranges=None):
+        self.text = text
+        # tag -> ((start, end), ...) as character offsets into text
+        self.ranges = {tag: tuple(spans) for tag, spans in (ranges or {}).items()}
+
+    @classmethod
+    def from_text_widget(cls, widget, tags=FORMAT_TAGS):
+        text = widget.get("1.0", "end-1c")
+        if not tags:
+            return cls(text)
+        # offset of the first character of every line, for "line.col" indices
+        line_starts = [0]
+        for match in re.finditer("\n", text):
+            line_starts.append(match.end())
+
+        def offset(index):
+            # a range can end at Tk's "end", the line after the last one
+            # (e.g. Select All, then Bold), which get() leaves out
+            line, column = (int(part) for part in str(index).split("."))
+            if line > len(line_starts):
+                return len(text)
+            return min(line_starts[line - 1] + column, len(text))
+
+        ranges = {}
+        for tag in tags:
+            bounds = [offset(index) for index in widget.tag_ranges(tag)]
+            ranges[tag] = tuple(zip(bounds[0::2], bounds[1::2]))
+        return cls(text, ranges)
+
+    def iter_runs(self, start=0, end=None):
+        # (start, end, tags) for every stretch of text between formatting
+        # changes, covering [start, end) without gaps.
+        end = len(self.text) if end is None else end
+        events = []
+        for tag, spans in self.ranges.items():
+            for span_start, span_end in spans:
+                if span_end > start and span_start < end:
+                    events.append((max(span_start, start), 1, tag))
+                    events.append((min(span_end, end), -1, tag))
+        events.sort()
+
+        active = {}
+        position = start
+        for point, change, tag in events:
+            if point > position:
+                yield position, point, frozenset(t for t, count in active.items() if count)
+                position = point
+            active[tag] = active.get(tag, 0) + change
+        if position < end:
+            yield position, end, frozenset(t for t, count in active.items() if count)
+
+    def iter_paragraphs(self):
+        # (start, end) of every line of the buffer, without the newline.
+        start = 0
+        text = self.text
+        while True:
+            end = text.find("\n", start)
+            if end == -1:
+                yield start, len(text)
+                return
+            yield start, end
+            start = end + 1
+
+    def iter_paragraph_runs(self):
+        # [(text, tags), ...] per paragraph, from one sweep over all runs.
+        runs = self.iter_runs()
+        run_start, run_end, tags = next(runs, (0, 0, frozenset()))
+        for start, end in self.iter_paragraphs():
+            pieces = []
+            position = start
+            while position < end:
+                while run_end <= position:
+                    run_start, run_end, tags = next(runs)
+                piece_end = min(run_end, end)
+                pieces.append((self.text[position:piece_end], tags))
+                position = piece_end
+            yield pieces
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+TEXT_CHUNK = 1024 * 1024
+
+
+def export_text(snapshot, path, progress=None, encoding=None):
+    # Written with the locale encoding and the trailing newline that
+    # get("1.0", END) used to add, so saved files do not change.
+    encoding = encoding or locale.getpreferredencoding(False)
+    text = snapshot.text
+    total = len(text)
+    with open(path, "w", encoding=encoding) as f:
+        for start in range(0, total, TEXT_CHUNK):
+            f.write(text[start:start + TEXT_CHUNK])
+            if progress is not None:
+                progress(min(start + TEXT_CHUNK, total), total)
+        f.write("\n")
+
+
+# reportlab's standard fonts, so nothing has to be embedded
+PDF_FONTS = {
+    frozenset(): "Helvetica",
+    frozenset(["bold"]): "Helvetica-Bold",
+    frozenset(["italic"]): "Helvetica-Oblique",
+    frozenset(["bold", "italic"]): "Helvetica-BoldOblique",
+}
+
+PDF_FONT_SIZE = 12
+PDF_LEADING = 14.4
+PDF_MARGIN = 54  # 0.75 inch
+TAB = "    "
+
+_TOKENS = re.compile(r"\S+|\s+")
+
+
+@functools.lru_cache(maxsize=65536)
+def text_width(text, font, size=PDF_FONT_SIZE):
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    return stringWidth(text, font, size)
+
+
+def pdf_font(tags):
+    return PDF_FONTS[tags & frozenset(["bold", "italic"])]
+
+
+class PdfWriter:
+    # Lays out lines of (text, font, underline) segments page by page.
+    def __init__(self, path, pagesize=None, font_size=PDF_FONT_SIZE, leading=PDF_LEADING, margin=PDF_MARGIN):
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+
+        self.pagesize = pagesize or letter
+        self.font_size = font_size
+        self.leading = leading
+        self.margin = margin
+        self.canvas = canvas.Canvas(path, pagesize=self.pagesize, pageCompression=1)
+        self.width = self.pagesize[0] - 2 * margin
+        self.pages = 0
+        self.text = None
+        self.font = None
+        self.underlines = []
+        self.y = 0
+
+    def new_page(self):
+        self.text = self.canvas.beginText(self.margin, self.pagesize[1] - self.margin - self.font_size)
+        self.text.setLeading(self.leading)
+        self.font = None
+        self.y = self.pagesize[1] - self.margin - self.font_size
+        self.underlines = []
+
+    def end_page(self):
+        self.canvas.drawText(self.text)
+        for x1, x2, y in self.underlines:
+            self.canvas.line(x1, y, x2, y)
+        self.canvas.showPage()
+        self.pages += 1
+        self.text = None
+
+    def line(self, segments):
+        if self.text is None:
+            self.new_page()
+        x = self.margin
+        for text, font, underline in segments:
+            if font != self.font:
+                # font switches are not free in reportlab; most lines have none
+                self.text.setFont(font, self.font_size, self.leading)
+                self.font = font
+            self.text.textOut(text)
+            width = text_width(text, font, self.font_size)
+            if underline and text.strip():
+                self.underlines.append((x, x + width, self.y - 1.5))
+            x += width
+        self.text.textLine()
+        self.y -= self.leading
+        if self.y < self.margin:
+            self.end_page()
+
+    def paragraph(self, pieces):
+        # Wraps one paragraph at the margin; words too long for a line are
+        # broken between characters.
+        line, line_width = [], 0.0
+        for text, tags in pieces:
+            font = pdf_font(tags)
+            underline = "underline" in tags
+            for token in _TOKENS.findall(text.replace("\t", TAB)):
+                width = text_width(token, font, self.font_size)
+                if line_width + width > self.width and line:
+                    if token.isspace():
+                        continue  # the break swallows the space
+                    self.line(line)
+                    line, line_width = [], 0.0
+                while width > self.width:
+                    cut = self.fit(token, font, self.width - line_width)
+                    line.append((token[:cut], font, underline))
+                    self.line(line)
+                    line, line_width = [], 0.0
+                    token = token[cut:]
+                    width = text_width(token, font, self.font_size)
+                if line and line[-1][1] == font and line[-1][2] == underline:
+                    line[-1] = (line[-1][0] + token, font, underline)
+                else:
+                    line.append((token, font, underline))
+                line_width += width
+        self.line(line)
+
+    def fit(self, token, font, room):
+        # How many leading characters of token fit in room (at least one).
+        # the standard fonts have no kerning, so widths simply add up
+        cut, used = 1, text_width(token[0], font, self.font_size)
+        while cut < len(token):
+            used += text_width(token[cut], font, self.font_size)
+            if used > room:
+                break
+            cut += 1
+        return cut
+
+    def save(self):
+        if self.text is not None or self.pages == 0:
+            if self.text is None:
+                self.new_page()
+            self.end_page()
+        self.canvas.save()
+
+
+def export_pdf(snapshot, path, progress=None, pagesize=None):
+    # progress(done, total) is called after every paragraph with character
+    # counts; it may raise ExportCancelled to stop. Returns the page count.
+    writer = PdfWriter(path, pagesize)
+    total = len(snapshot.text)
+    done = 0
+    for pieces in snapshot.iter_paragraph_runs():
+        writer.paragraph(pieces)
+        done += sum(len(text) for text, tags in pieces) + 1
+        if progress is not None:
+            progress(min(done, total), total)
+    writer.save()
+    return writer.pages
+
+
+def export_docx(snapshot, path, progress=None):
+    # One paragraph per line, one run per formatting run, in a single pass.
+    # progress works as in export_pdf.
+    from docx import Document
+    from docx.oxml import OxmlElement
+    from docx.text.paragraph import Paragraph
+
+    document = Document()
+    body = document.element.body
+    # Document.add_paragraph() searches the body for the section properties
+    # on every call, which makes it quadratic in the paragraph count; new
+    # paragraphs go straight in front of them instead.
+    section = body.sectPr
+    total = len(snapshot.text)
+    done = 0
+    for pieces in snapshot.iter_paragraph_runs():
+        element = OxmlElement("w:p")
+        if section is not None:
+            section.addprevious(element)
+        else:
+            body.append(element)
+        paragraph = Paragraph(element, document._body)
+        for text, tags in pieces:
+            run = paragraph.add_run(text)
+            if "bold" in tags:
+                run.bold = True
+            if "italic" in tags:
+                run.italic = True
+            if "underline" in tags:
+                run.underline = True
+        done += sum(len(text) for text, tags in pieces) + 1
+        if progress is not None:
+            progress(min(done, total), total)
+    document.save(path)
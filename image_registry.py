@@ -0,0 +1,113 @@
+"""
+Images embedded in the text editor.
+
+Tk deletes a photo image as soon as its Python PhotoImage is garbage
+collected, and add_image used to keep only the last one in self.image, so
+earlier images vanished from the document. An ImageRegistry holds on to
+every PhotoImage that is still embedded in the Text widget; the same file at
+the same size is shared by all the places it is embedded. prune() releases
+the ones that are no longer in the widget, e.g. after a new file is opened.
+It walks every embedded image, so embed() does not call it directly: it is
+queued with after_idle() once per burst of inserts, which keeps inserting n
+images linear instead of quadratic.
+
+Images are decoded straight to thumbnail size: JPEGs through the decoder's
+draft mode (DCT scaling, so a 24-megapixel photo is never fully decoded),
+other formats with thumbnail(). The decoded renditions are kept in an LRU
+cache bounded by a memory budget, so embedding an image again does not read
+the file again, and a document with hundreds of images stays small.
+"""
+import collections
+import os
+
+THUMBNAIL_SIZE = (100, 100)
+# bytes of decoded renditions kept for re-use
+RENDITION_BUDGET = 32 * 1024 * 1024
+EXIF_ORIENTATION = 0x0112
+
+
+def rendition_key(path, size):
+    # An edited file gets a new key, so a stale rendition is never shown.
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size, tuple(size)
+
+
+def load_rendition(path, size):
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as image:
+        width, height = image.size
+        if image.getexif().get(EXIF_ORIENTATION) in (5, 6, 7, 8):
+            width, height = height, width  # stored sideways, shown upright
+        scale = min(size[0] / width, size[1] / height, 1.0)
+        # only JPEG implements draft(); it decodes at the nearest 1/2, 1/4 or
+        # 1/8 scale that is still at least the requested size
+        image.draft("RGB", (max(1, round(image.width * scale)), max(1, round(image.height * scale))))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+        image.thumbnail(size, Image.LANCZOS)
+        image.load()
+        return image
+
+
+def rendition_bytes(image):
+    return image.width * image.height * len(image.getbands())
+
+
+class ImageRegistry:
+    def __init__(self, budget=RENDITION_BUDGET, size=THUMBNAIL_SIZE):
+        self.budget = budget
+        self.size = size
+        # rendition key -> PhotoImage, for every image in the document
+        self.photos = {}
+        # rendition key -> PIL image, least recently used first
+        self.renditions = collections.OrderedDict()
+        self.rendition_total = 0
+        # after_idle() id of the queued prune, if any
+        self.prune_job = None
+
+    def rendition(self, key):
+        image = self.renditions.get(key)
+        if image is not None:
+            self.renditions.move_to_end(key)
+            return image
+        image = load_rendition(key[0], key[3])
+        self.renditions[key] = image
+        self.rendition_total += rendition_bytes(image)
+        while self.rendition_total > self.budget and len(self.renditions) > 1:
+            _, evicted = self.renditions.popitem(last=False)
+            self.rendition_total -= rendition_bytes(evicted)
+        return image
+
+    def photo(self, path, size=None):
+        from PIL import ImageTk
+
+        key = rendition_key(path, size or self.size)
+        photo = self.photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self.rendition(key))
+            self.photos[key] = photo
+        return photo
+
+    def embed(self, widget, index, path, size=None):
+        # Inserts the image at index and keeps it alive while it is shown;
+        # images deleted meanwhile are released once the inserts are done.
+        photo = self.photo(path, size)
+        widget.image_create(index, image=photo)
+        if self.prune_job is None:
+            self.prune_job = widget.after_idle(self.prune, widget)
+        return photo
+
+    def prune(self, widget):
+        # Releases the PhotoImages that are no longer embedded in widget; their
+        # renditions stay cached in case they come back.
+        if self.prune_job is not None:
+            widget.after_cancel(self.prune_job)
+            self.prune_job = None
+        if not self.photos:
+            return
+        shown = {str(widget.image_cget(name, "image")) for name in widget.image_names()}
+        for key, photo in list(self.photos.items()):
+            if str(photo) not in shown:
+                del self.photos[key]
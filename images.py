@@ -0,0 +1,162 @@
+"""
+Responsive image variants for photo slides.
+
+Photo slides used to point straight at the uploaded file, which is often a
+multi-megabyte camera JPEG. optimize_images() downscales every photo asset to
+a few widths and encodes each width as AVIF (when Pillow was built with it)
+and WebP, next to the original in ASSETS/. The slide then wraps its <img> in a
+<picture> whose srcset/sizes let the browser pick the smallest variant that
+fills the slide; the original stays as the fallback src.
+
+Encoding is CPU-bound, so images are processed in a process pool, one image
+per task. Variants are named after the source (<stem>-<width>w.<format>) and
+skipped when they are already newer than it, so a rebuild only encodes new
+uploads. In a staged build the variants are written into the staging tree
+and go live with the pages (see staging.py). Without Pillow the stage does nothing and slides keep the plain <img>;
+so does a photo whose variants fail to encode, which is reported on stderr.
+"""
+import functools
+import math
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+WIDTHS = (480, 960, 1600)
+
+# Smallest first: the first <source> the browser supports wins.
+FORMATS = ("avif", "webp")
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+SAVE_OPTIONS = {
+    "avif": {"quality": 60},
+    "webp": {"quality": 80, "method": 4},
+}
+
+# Slides are laid out in a Bootstrap .container, 1320px wide at most.
+SIZES = "(min-width: 1400px) 1320px, 100vw"
+
+EXIF_ORIENTATION = 0x0112
+
+
+@functools.lru_cache(maxsize=None)
+def available_formats():
+    try:
+        from PIL import features
+    except ImportError:
+        return ()
+    return tuple(fmt for fmt in FORMATS if features.check(fmt))
+
+
+def variant_widths(width, widths=WIDTHS):
+    # Every configured width up to the original, plus the original width
+    # itself when it is smaller than the largest one; never upscales.
+    chosen = [w for w in widths if w <= width]
+    if width < max(widths) and width not in chosen:
+        chosen.append(width)
+    return chosen
+
+
+def variant_name(name, width, fmt):
+    stem = os.path.splitext(name)[0]
+    return f"{stem}-{width}w.{fmt}"
+
+
+def is_current(path, source_mtime):
+    try:
+        return os.stat(path).st_mtime_ns >= source_mtime
+    except OSError:
+        return False
+
+
+def save_variant(image, path, fmt):
+    # Written under a temporary name, so a half-encoded file is never served.
+    fd, tmp_path = tempfile.mkstemp(prefix=".variant-", dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        image.save(tmp_path, fmt.upper(), **SAVE_OPTIONS[fmt])
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def encode_variants(image, width, output_dir, name, targets, formats, missing):
+    from PIL import Image, ImageOps
+
+    # lets the JPEG decoder scale down while decoding
+    scale = max(targets) / width
+    image.draft("RGB", (math.ceil(image.width * scale), math.ceil(image.height * scale)))
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+    for w in sorted({w for fmt, w in missing}, reverse=True):
+        resized = image.resize((w, max(1, round(image.height * w / image.width))), Image.LANCZOS)
+        for fmt in formats:
+            if (fmt, w) in missing:
+                save_variant(resized, os.path.join(output_dir, variant_name(name, w, fmt)), fmt)
+
+
+def optimize(source, output_dir=None, widths=WIDTHS, formats=None):
+    # Builds the variants of one image; returns [[format, width, name], ...]
+    # with names relative to the source's folder. They are written into
+    # output_dir (a staged build's ASSETS, default the source's folder); ones
+    # already current in either folder are kept. Runs in a worker process.
+    from PIL import Image
+
+    formats = available_formats() if formats is None else formats
+    folder, name = os.path.split(source)
+    output_dir = output_dir or folder
+    source_mtime = os.stat(source).st_mtime_ns
+    try:
+        image = Image.open(source)
+    except (OSError, ValueError):
+        return []
+
+    with image:
+        if getattr(image, "is_animated", False):
+            # downscaling would keep only the first frame of a GIF or APNG
+            return []
+        width, height = image.size
+        if image.getexif().get(EXIF_ORIENTATION) in (5, 6, 7, 8):
+            width, height = height, width  # stored sideways, shown upright
+        targets = variant_widths(width, widths)
+        missing = [(fmt, w) for fmt in formats for w in targets
+                   if not any(is_current(os.path.join(where, variant_name(name, w, fmt)), source_mtime)
+                              for where in {folder, output_dir})]
+        if missing:
+            try:
+                encode_variants(image, width, output_dir, name, targets, formats, missing)
+            except Exception as e:
+                # a truncated upload or an encoder bug costs this image its
+                # variants, not the build; the slide shows the original
+                print(f"Unable to encode variants of {source}: {e}", file=sys.stderr)
+                return []
+
+    return [[fmt, w, variant_name(name, w, fmt)] for fmt in formats for w in targets]
+
+
+def optimize_images(sources, jobs=None, executor=None, output_dirs=None):
+    # Maps each source path to its variants (see optimize). output_dirs maps
+    # a source to the folder its variants go to; executor reuses an existing
+    # pool; jobs=1 encodes in this process.
+    sources = sorted(set(sources))
+    formats = available_formats()
+    if not sources or not formats:
+        return {}
+
+    work = functools.partial(optimize, formats=formats)
+    targets = [(output_dirs or {}).get(source) for source in sources]
+    if executor is not None:
+        results = list(executor.map(work, sources, targets))
+    elif jobs == 1 or len(sources) == 1:
+        results = [work(source, target) for source, target in zip(sources, targets)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(work, sources, targets))
+    return {source: variants for source, variants in zip(sources, results) if variants}
+
+
+def srcset(variants, fmt, prefix=""):
+    return ", ".join(f"{prefix}{name} {width}w" for variant_fmt, width, name in variants if variant_fmt == fmt)
@@ -0,0 +1,301 @@
+"""
+Progressive file loading for the text editor.
+
+Opening a multi-hundred-MB transcript used to read and insert the whole file
+in one call on the Tk thread, freezing the window until it was done. A
+TextFileLoader instead reads the file in chunks (through mmap for very large
+files), decodes them incrementally and inserts one chunk per after()
+callback, so the window keeps repainting and responding while the text
+streams in. Progress goes to a status_bar.StatusBar, whose Cancel button
+stops the load and keeps what was inserted so far.
+
+Word documents are handled by DocxLoader. python-docx builds the whole
+document tree before the first paragraph is available, so the loader reads
+word/document.xml itself with a streaming parser on a worker thread. Body
+paragraphs come back in batches through a queue, with the bold, italic and
+underline runs already merged into tagged ranges; the Tk thread polls the
+queue and inserts each batch with its tags in a single call. The first
+screenful shows up while the rest of the document is still being parsed.
+"""
+import codecs
+import io
+import locale
+import mmap
+import os
+import queue
+import threading
+import time
+import zipfile
+from xml.etree import ElementTree
+
+CHUNK_SIZE = 256 * 1024
+# files above this are mapped instead of read through a buffer
+MMAP_THRESHOLD = 64 * 1024 * 1024
+# milliseconds between two chunks, so pending events get handled
+STEP_DELAY = 1
+
+
+class TextFileLoader:
+    def __init__(self, widget, path, status=None, on_done=None, encoding=None):
+        self.widget = widget
+        self.path = path
+        self.status = status
+        self.on_done = on_done
+        # open() used the locale encoding, and so does the loader
+        encoding = encoding or locale.getpreferredencoding(False)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        # \r\n and \r become \n, as in text mode
+        self.decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+        self.file = None
+        self.map = None
+        self.offset = 0
+        self.size = 0
+        self.job = None
+        self.cancelled = False
+
+    def start(self):
+        self.file = open(self.path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        if self.size >= MMAP_THRESHOLD:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.widget.delete("1.0", "end")
+        if self.status is not None:
+            self.status.start(self, f"Opening {os.path.basename(self.path)}...", self.cancel)
+        self.job = self.widget.after_idle(self.step)
+
+    def read(self):
+        if self.map is not None:
+            chunk = self.map[self.offset:self.offset + CHUNK_SIZE]
+        else:
+            chunk = self.file.read(CHUNK_SIZE)
+        self.offset += len(chunk)
+        return chunk
+
+    def step(self):
+        self.job = None
+        try:
+            chunk = self.read()
+            text = self.decoder.decode(chunk, final=not chunk)
+            if text:
+                self.widget.insert("end-1c", text)
+        except (OSError, ValueError) as e:
+            self.finish(f"Error reading {os.path.basename(self.path)}: {e}", e)
+            return
+        if not chunk:
+            self.finish(f"Opened {os.path.basename(self.path)}")
+            return
+        if self.status is not None:
+            self.status.progress(self, self.offset, self.size)
+        self.job = self.widget.after(STEP_DELAY, self.step)
+
+    def cancel(self):
+        if self.file is None:
+            return  # already finished
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+        self.cancelled = True
+        self.finish(f"Stopped loading {os.path.basename(self.path)} at {self.offset * 100 // max(self.size, 1)}%")
+
+    def finish(self, message, error=None):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if self.status is not None:
+            self.status.finish(self, message)
+        if self.on_done is not None:
+            self.on_done(self, error)
+
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# run properties -> editor tag (the tags TextEditorApp configures)
+RUN_TAGS = ((W + "b", "bold"), (W + "i", "italic"), (W + "u", "underline"))
+OFF_VALUES = frozenset(["0", "false", "off", "none"])
+
+BATCH_CHARS = 32 * 1024
+# milliseconds between two polls of the parser's queue
+POLL_DELAY = 20
+# Tk thread time per poll, so a fast parser cannot starve the event loop
+POLL_BUDGET = 0.03
+
+
+def run_tags(run):
+    # Direct run formatting only, like python-docx's Run.bold/italic/underline.
+    properties = run.find(W + "rPr")
+    if properties is None:
+        return ()
+    tags = []
+    for tag_name, tag in RUN_TAGS:
+        element = properties.find(tag_name)
+        if element is not None and element.get(W + "val", "true").lower() not in OFF_VALUES:
+            tags.append(tag)
+    return tuple(tags)
+
+
+def run_text(run):
+    parts = []
+    for child in run:
+        if child.tag == W + "t":
+            parts.append(child.text or "")
+        elif child.tag == W + "tab":
+            parts.append("\t")
+        elif child.tag in (W + "br", W + "cr"):
+            parts.append("\n")
+        elif child.tag == W + "noBreakHyphen":
+            parts.append("-")
+    return "".join(parts)
+
+
+def paragraph_runs(paragraph):
+    # [(text, tags), ...] of the paragraph, hyperlink runs included
+    runs = []
+    for run in paragraph.iter(W + "r"):
+        text = run_text(run)
+        if text:
+            runs.append((text, run_tags(run)))
+    return runs
+
+
+def iter_docx_paragraphs(stream):
+    # Body paragraphs of a word/document.xml stream, as lists of runs; table
+    # cells and headers are skipped, as in python-docx's Document.paragraphs.
+    path = []
+    for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            path.append(element.tag)
+            continue
+        path.pop()
+        if path and path[-1] == W + "body":
+            if element.tag == W + "p":
+                yield paragraph_runs(element)
+            element.clear()  # parsed content is not kept
+
+
+class CountingReader:
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.count += len(data)
+        return data
+
+
+class DocxLoader:
+    def __init__(self, widget, path, status=None, on_done=None):
+        self.widget = widget
+        self.path = path
+        self.status = status
+        self.on_done = on_done
+        self.batches = queue.Queue(maxsize=64)
+        self.stop = threading.Event()
+        self.thread = None
+        self.job = None
+        self.done = 0
+        self.size = 0
+        self.cancelled = False
+        self.finished = False
+
+    def start(self):
+        self.widget.delete("1.0", "end")
+        if self.status is not None:
+            self.status.start(self, f"Opening {os.path.basename(self.path)}...", self.cancel)
+        self.thread = threading.Thread(target=self.parse, name="docx-loader", daemon=True)
+        self.thread.start()
+        self.job = self.widget.after(POLL_DELAY, self.poll)
+
+    def put(self, item):
+        # Blocks while the Tk thread is behind, unless the load is cancelled.
+        while not self.stop.is_set():
+            try:
+                self.batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def parse(self):
+        # Worker thread: never touches Tk, only the queue. It always ends with
+        # a "done" or "error" item, or poll() would wait for one forever.
+        result = ("error", RuntimeError("the parser stopped"), 0)
+        try:
+            with zipfile.ZipFile(self.path) as archive:
+                info = archive.getinfo("word/document.xml")
+                self.size = info.file_size
+                with archive.open(info) as member:
+                    reader = CountingReader(member)
+                    segments = []
+                    chars = 0
+                    first = True
+                    for runs in iter_docx_paragraphs(reader):
+                        if not first:
+                            segments.append(("\n", ()))
+                        first = False
+                        segments.extend(runs)
+                        chars += sum(len(text) for text, tags in runs) + 1
+                        if chars >= BATCH_CHARS:
+                            if not self.put(("batch", segments, reader.count)):
+                                return
+                            segments, chars = [], 0
+                    self.put(("batch", segments, reader.count))
+            result = ("done", None, self.size)
+        except Exception as e:
+            # also encrypted members, unsupported compression, bad encodings
+            result = ("error", e, 0)
+        finally:
+            self.put(result)
+
+    def poll(self):
+        self.job = None
+        deadline = time.monotonic() + POLL_BUDGET
+        while time.monotonic() < deadline:
+            try:
+                kind, value, done = self.batches.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "batch":
+                self.insert(value)
+                self.done = done
+            elif kind == "done":
+                self.finish(f"Opened {os.path.basename(self.path)}")
+                return
+            else:
+                self.finish(f"Error reading {os.path.basename(self.path)}: {value}", value)
+                return
+        if self.status is not None:
+            self.status.progress(self, self.done, self.size)
+        self.job = self.widget.after(POLL_DELAY, self.poll)
+
+    def insert(self, segments):
+        # Neighbouring runs with the same formatting become one tagged range,
+        # and the whole batch goes in with one insert call.
+        args = []
+        for text, tags in segments:
+            if args and args[-1] == tags:
+                args[-2] += text
+            else:
+                args.extend([text, tags])
+        if args:
+            self.widget.insert("end-1c", *args)
+
+    def cancel(self):
+        if self.finished:
+            return
+        self.cancelled = True
+        self.finish(f"Stopped loading {os.path.basename(self.path)} at {self.done * 100 // max(self.size, 1)}%")
+
+    def finish(self, message, error=None):
+        self.finished = True
+        self.stop.set()
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+        if self.status is not None:
+            self.status.finish(self, message)
+        if self.on_done is not None:
+            self.on_done(self, error)
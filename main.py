@@ -1,10 +1,8 @@
 import tkinter as tk
 from tkinter import filedialog, simpledialog, messagebox, ttk
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from PIL import Image, ImageTk
-from docx import Document
-from ttkthemes import ThemedTk
+from status_bar import StatusBar
+# reportlab, python-docx, Pillow and ttkthemes are imported where they are
+# first needed, so the window comes up without them (see bench_startup.py)
 class TextEditorApp:
     def __init__(self, root):
         # Initialize main window
@@ -15,8 +13,15 @@ class TextEditorApp:
         self.root.geometry(f"{self.width}x{self.height}")
         self.root.resizable(True, True)
 
-        # Set theme
-        self.root.set_theme("arc")  # You can change this theme
+        # Set theme once the window has been drawn; loading it is the slowest
+        # part of startup
+        self.style = None
+        self.theme = "arc"  # You can change this theme
+
+        # Status bar for long-running tasks (packed first so it spans the window)
+        self.status_bar = StatusBar(self.root)
+        self.status_bar.pack(side="bottom", fill="x")
+        self.loader = None
 
         # Create a Frame for the Sidebar
         self.sidebar = tk.Frame(self.root, width=200, bg="#f0f0f0", relief="sunken", bd=2)
@@ -59,6 +64,14 @@ class TextEditorApp:
         self.text_widget.tag_configure("italic", font=("Arial", 12, "italic"))
         self.text_widget.tag_configure("underline", font=("Arial", 12, "underline"))
 
+        self.text_widget.bind("<Expose>", self.first_paint)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Saves run in the background and report to the status bar
+        self.exports = None
+        # Every image embedded in the document
+        self.images = None
+
         # Create a Menu object
         self.main_menu = tk.Menu(self.root)
         self.root.config(menu=self.main_menu)
@@ -68,7 +81,7 @@ class TextEditorApp:
         self.file_menu.add_command(label="Open", command=self.open_file)  # New open file option
         self.file_menu.add_command(label="New Description", command=self.new_course_description)
         self.file_menu.add_command(label="New Course", command=self.new_course)
-        self.file_menu.add_command(label="Exit", command=self.root.destroy)
+        self.file_menu.add_command(label="Exit", command=self.close)
 
         self.settings_menu = tk.Menu(self.main_menu, tearoff=0)
         self.settings_menu.add_command(label="⚙️ General Settings", command=self.open_general_settings)
@@ -116,9 +129,9 @@ class TextEditorApp:
                                             filetypes=[("Text Files", "*.txt"),
                                                       ("All Files", "*.*")])
         if file:
-            content = self.text_widget.get(1.0, tk.END)  # Get the content of the text widget
-            with open(file, 'w') as f:
-                f.write(content)
+            # written on a worker thread, see export_queue.py
+            from exporters import export_text
+            self.export(export_text, file, tags=())
 
     # Function to apply text customization settings
     def apply_text_format(self, format_type):
@@ -149,30 +162,65 @@ class TextEditorApp:
                                                          ("All Files", "*.*")])
         if file_path:
             try:
+                from loaders import DocxLoader, TextFileLoader
                 if file_path.endswith(".txt"):
-                    with open(file_path, 'r') as file:
-                        content = file.read()
-                        self.text_widget.delete(1.0, tk.END)
-                        self.text_widget.insert(tk.END, content)
+                    # streamed in chunks, see loaders.py
+                    self.start_loader(TextFileLoader(self.text_widget, file_path, self.status_bar,
+                                                     self.loader_done))
                 elif file_path.endswith(".docx"):
-                    doc = Document(file_path)
-                    content = "\n".join([para.text for para in doc.paragraphs])
-                    self.text_widget.delete(1.0, tk.END)
-                    self.text_widget.insert(tk.END, content)
+                    # parsed on a worker thread, shown batch by batch
+                    self.start_loader(DocxLoader(self.text_widget, file_path, self.status_bar,
+                                                 self.loader_done))
             except Exception as e:
                 messagebox.showerror("Error", f"Unable to open the file: {e}")
 
+    def start_loader(self, loader):
+        # Only one file loads at a time; a new open stops the previous one.
+        if self.loader is not None:
+            self.loader.cancel()
+        self.loader = loader
+        loader.start()
+        if self.images is not None:
+            self.images.prune(self.text_widget)  # the old document is gone
+
+    def loader_done(self, loader, error):
+        if loader is self.loader:
+            self.loader = None
+        if error is not None:
+            messagebox.showerror("Error", f"Unable to open the file: {error}")
+
+    def export(self, exporter, file, **options):
+        from export_queue import ExportQueue
+        if self.exports is None:
+            self.exports = ExportQueue(self.text_widget, self.status_bar, self.export_done)
+        try:
+            self.exports.submit(exporter, file, **options)
+        except Exception as e:
+            # the snapshot is taken here, on the Tk thread
+            messagebox.showerror("Error", f"Unable to save the file: {e}")
+
+    def export_done(self, job, error):
+        from exporters import ExportCancelled
+        if error is not None and not isinstance(error, ExportCancelled):
+            messagebox.showerror("Error", f"Unable to save the file: {error}")
+
+    def close(self):
+        # Pending exports are dropped instead of keeping the process alive
+        if self.exports is not None:
+            self.exports.close()
+        if self.loader is not None:
+            self.loader.cancel()
+        self.root.destroy()
+
     # Function to save as PDF
     def save_as_pdf(self):
         file = filedialog.asksaveasfilename(defaultextension=".pdf",
                                             filetypes=[("PDF Files", "*.pdf"),
                                                       ("All Files", "*.*")])
         if file:
-            content = self.text_widget.get(1.0, tk.END)
-            pdf_canvas = canvas.Canvas(file, pagesize=letter)
-            pdf_canvas.setFont("Helvetica", 12)
-            pdf_canvas.drawString(30, 750, content)
-            pdf_canvas.save()
+            # wrapped and paginated with the text's formatting, see exporters.py
+            from exporters import export_pdf
+            self.export(export_pdf, file)
 
     # Function to save as .docx
     def save_as_docx(self):
@@ -180,10 +228,9 @@ class TextEditorApp:
                                             filetypes=[("Word Document", "*.docx"),
                                                       ("All Files", "*.*")])
         if file:
-            doc = Document()
-            content = self.text_widget.get(1.0, tk.END)
-            doc.add_paragraph(content)
-            doc.save(file)
+            # one paragraph per line, with the bold/italic/underline runs
+            from exporters import export_docx
+            self.export(export_docx, file)
 
     # Function to save with custom extensions (like .py, .html, etc.)
     def save_with_extension(self):
@@ -193,20 +240,21 @@ class TextEditorApp:
                                                       ("HTML Files", "*.html"),
                                                       ("All Files", "*.*")])
         if file:
-            content = self.text_widget.get(1.0, tk.END)
-            with open(file, 'w') as f:
-                f.write(content)
+            from exporters import export_text
+            self.export(export_text, file, tags=())
 
     # Function to add an image to the text editor
     def add_image(self):
         file = filedialog.askopenfilename(filetypes=[("Image Files", "*.png;*.jpg;*.jpeg;*.gif")])
         if file:
-            img = Image.open(file)
-            img = img.resize((100, 100))
-            img_tk = ImageTk.PhotoImage(img)
-            self.text_widget.image_create(tk.END, image=img_tk)
-            # Keep a reference to the image to prevent garbage collection
-            self.image = img_tk
+            from image_registry import ImageRegistry
+            if self.images is None:
+                self.images = ImageRegistry()
+            try:
+                # decoded at thumbnail size and kept alive, see image_registry.py
+                self.images.embed(self.text_widget, tk.END, file)
+            except Exception as e:
+                messagebox.showerror("Error", f"Unable to add the image: {e}")
 
     # Function to create a table in the text editor
     def create_table(self):
@@ -246,13 +294,24 @@ class TextEditorApp:
 
         # Apply theme (simplified logic for this example)
         if theme == "Dark":
-            self.root.set_theme("radiance")  # Example theme
+            self.set_theme("radiance")  # Example theme
         else:
-            self.root.set_theme("arc")  # Light theme
+            self.set_theme("arc")  # Light theme
 
         # Apply font size
         self.text_widget.config(font=("Arial", font_size))
 
+    def first_paint(self, event):
+        self.text_widget.unbind("<Expose>")
+        self.root.after_idle(self.set_theme, self.theme)
+
+    def set_theme(self, theme):
+        from ttkthemes import ThemedStyle
+        if self.style is None:
+            self.style = ThemedStyle(self.root)
+        self.theme = theme
+        self.style.set_theme(theme)
+
     # Function to display the "About" dialog
     def show_about(self):
         about_window = tk.Toplevel(self.root)
@@ -290,6 +349,6 @@ class TextEditorApp:
         tk.Button(instructions_window, text="Close", command=instructions_window.destroy).pack(pady=10)
 
 if __name__ == "__main__":
-    root = ThemedTk()  # Use ThemedTk to enable themes
+    root = tk.Tk()  # themed through a ThemedStyle once it is on screen
     app = TextEditorApp(root)
     root.mainloop()
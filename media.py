@@ -0,0 +1,128 @@
+"""
+Media classification for slide attachments.
+
+A slide's media reference is mapped to one of DOCUMENT, PHOTO, AUDIO or VIDEO
+(or None for anything that should just be embedded as an external page) with
+a single dictionary lookup on its extension. When the extension is unknown or
+ambiguous (ogg and webm carry audio or video), the file in the course's ASSETS
+folder is sniffed by its magic bytes. Sniff results are cached per path and
+modification time, so a large course only ever reads each asset once.
+"""
+import os
+from urllib.parse import urlsplit
+
+DOCUMENT = "document"
+PHOTO = "photo"
+AUDIO = "audio"
+VIDEO = "video"
+
+# One kind per extension. The old per-slide lists overlapped and the first
+# matching branch won, which is kept here: svg is a document, ogg and webm
+# are audio unless sniffing finds a video track.
+EXTENSION_KINDS = {}
+for _kind, _extensions in (
+        (VIDEO, "mp4 mov mkv avi flv m4v 3gp wmv"),
+        (AUDIO, "mp3 ogg wav aac m4a flac webm opus"),
+        (PHOTO, "jpg jpeg png gif webp bmp ico tiff tif apng avif"),
+        (DOCUMENT, "html htm pdf txt xml xhtml csv json svg docx xlsx ods odt rtf yaml md")):
+    for _extension in _extensions.split():
+        EXTENSION_KINDS[_extension] = _kind
+
+AMBIGUOUS_EXTENSIONS = frozenset(["ogg", "webm"])
+
+SNIFF_BYTES = 4096
+
+# (offset, signature, kind), checked in order
+MAGIC_NUMBERS = [
+    (0, b"%PDF", DOCUMENT),
+    (0, b"\x89PNG\r\n\x1a\n", PHOTO),
+    (0, b"\xff\xd8\xff", PHOTO),
+    (0, b"GIF87a", PHOTO),
+    (0, b"GIF89a", PHOTO),
+    (0, b"BM", PHOTO),
+    (0, b"\x00\x00\x01\x00", PHOTO),
+    (0, b"II*\x00", PHOTO),
+    (0, b"MM\x00*", PHOTO),
+    (0, b"ID3", AUDIO),
+    (0, b"fLaC", AUDIO),
+    (0, b"FLV", VIDEO),
+    (0, b"\x30\x26\xb2\x75\x8e\x66\xcf\x11", VIDEO),  # ASF (wmv)
+    (0, b"PK\x03\x04", DOCUMENT),  # docx, xlsx, odt
+]
+
+RIFF_KINDS = {b"WEBP": PHOTO, b"WAVE": AUDIO, b"AVI ": VIDEO}
+
+# ISO base media brands (bytes 8-12 of an ftyp box)
+FTYP_KINDS = {b"avif": PHOTO, b"avis": PHOTO, b"heic": PHOTO, b"mif1": PHOTO,
+              b"M4A ": AUDIO, b"M4B ": AUDIO}
+
+
+def media_extension(mediaFileUrl):
+    path = urlsplit(mediaFileUrl).path
+    return os.path.splitext(path)[1][1:].lower()
+
+
+def is_remote(mediaFileUrl):
+    # one-letter schemes are Windows drive letters, not URLs
+    return len(urlsplit(mediaFileUrl).scheme) > 1
+
+
+def sniff_bytes(head):
+    for offset, signature, kind in MAGIC_NUMBERS:
+        if head.startswith(signature, offset):
+            return kind
+
+    if head[:4] == b"RIFF":
+        return RIFF_KINDS.get(head[8:12])
+    if head[4:8] == b"ftyp":
+        return FTYP_KINDS.get(head[8:12], VIDEO)
+    if head[:4] == b"OggS":
+        return VIDEO if b"\x80theora" in head else AUDIO
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        # Matroska/WebM: codec ids start with V_ for video tracks
+        return VIDEO if b"V_" in head else AUDIO
+    if head[:2] == b"\xff\xfb" or head[:2] == b"\xff\xf3" or head[:2] == b"\xff\xf2":
+        return AUDIO  # bare MPEG audio frames
+
+    text = head.lstrip()[:256].lower()
+    if text.startswith((b"<?xml", b"<svg", b"<!doctype html", b"<html", b"{", b"[")):
+        return DOCUMENT
+    return None
+
+
+class MediaClassifier:
+    def __init__(self):
+        # (path, mtime_ns, size) -> kind
+        self._cache = {}
+
+    def sniff(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key not in self._cache:
+            try:
+                with open(path, "rb") as f:
+                    self._cache[key] = sniff_bytes(f.read(SNIFF_BYTES))
+            except OSError:
+                return None
+        return self._cache[key]
+
+    def classify(self, mediaFileUrl, assets_dir=None):
+        if not mediaFileUrl or is_remote(mediaFileUrl):
+            return None
+
+        extension = media_extension(mediaFileUrl)
+        kind = EXTENSION_KINDS.get(extension)
+        if kind is not None and extension not in AMBIGUOUS_EXTENSIONS:
+            return kind
+        if assets_dir:
+            sniffed = self.sniff(os.path.join(assets_dir, urlsplit(mediaFileUrl).path))
+            if sniffed is not None:
+                return sniffed
+        return kind
+
+
+_classifier = MediaClassifier()
+classify = _classifier.classify
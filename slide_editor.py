@@ -0,0 +1,196 @@
+"""
+Virtualized slide editor for the Creator wizard.
+
+The old slide window built nine labelled widgets for every slide of a module
+up front, which made opening it slow and capped modules at 30 slides. A
+SlideEditor keeps the slide values in a list of course_model.Slide and only creates
+enough slide forms to cover the visible part of its canvas (plus one above
+and below). Every form has the same height, so the slide under any scroll
+position is a division away; when the view scrolls, forms that left it write
+their values back to the list and are moved onto the slides that came in.
+The widget count therefore stays constant whether a module has 5 or 500
+slides, and set_slides() reuses the same forms for the next module.
+"""
+import tkinter as tk
+
+# (key, label) of every slide field, in form order
+FIELDS = [
+    ("header", "Header:"),
+    ("mediaFileUrl", "Media File url:"),
+    ("paragraph", "Paragraph:"),
+    ("question", "Question:"),
+    ("optA", "Option A:"),
+    ("optB", "Option B:"),
+    ("optC", "Option C:"),
+    ("optD", "Option D:"),
+    ("answer", "Correct Answer:"),
+]
+
+TEXT_FIELDS = frozenset(["paragraph"])
+
+# forms kept beyond each edge of the view, so small scrolls need no rebinding
+OVERSCAN = 1
+
+
+class SlideForm(tk.Frame):
+    # The widgets for one slide; rebound to another slide as the view scrolls.
+    def __init__(self, parent, bg="#f4f4f4"):
+        super().__init__(parent, bg=bg)
+        self.index = None
+        self.title = tk.Label(self, font=("Arial", 24), bg=bg)
+        self.title.pack(pady=10)
+        self.widgets = {}
+        for key, label in FIELDS:
+            tk.Label(self, text=label, font=("Arial", 18), bg=bg).pack(anchor="w", padx=10, pady=5)
+            if key in TEXT_FIELDS:
+                widget = tk.Text(self, font=("Arial", 12), width=100, height=6, bd=2, relief="solid")
+            else:
+                widget = tk.Entry(self, font=("Arial", 12), width=50, bd=2, relief="solid")
+            widget.pack(pady=5)
+            self.widgets[key] = widget
+
+    def load(self, index, slide):
+        self.index = index
+        self.title.config(text=f"Slide {index + 1}")
+        for key, widget in self.widgets.items():
+            if key in TEXT_FIELDS:
+                widget.delete("1.0", "end")
+                widget.insert("1.0", getattr(slide, key))
+                widget.edit_reset()
+            else:
+                widget.delete(0, "end")
+                widget.insert(0, getattr(slide, key))
+
+    def save(self, slide):
+        for key, widget in self.widgets.items():
+            setattr(slide, key, widget.get("1.0", "end-1c") if key in TEXT_FIELDS else widget.get())
+
+
+class SlideEditor(tk.Frame):
+    def __init__(self, parent, slides, bg="#f4f4f4"):
+        super().__init__(parent, bg=bg)
+        # edited in place; values of the forms on screen are written back by flush()
+        self.slides = slides
+        self.bg = bg
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+        self.canvas.bind("<Configure>", lambda e: self.refresh())
+        # the wheel scrolls the editor only while the pointer is over it
+        self.bind("<Enter>", lambda e: self.bind_wheel())
+        self.bind("<Leave>", self.on_leave)
+
+        # bound index -> form, free forms, canvas window of each form
+        self.bound = {}
+        self.free = []
+        self.windows = {}
+
+        # every form has the same layout, so one measures all of them
+        probe = self.new_form()
+        probe.update_idletasks()
+        self.slot_height = probe.winfo_reqheight()
+        self.slot_width = probe.winfo_reqwidth()
+        self.free.append(probe)
+
+        # holds whatever goes below the last slide (the Save & Next button)
+        self.footer = tk.Frame(self.canvas, bg=bg)
+        self.footer_window = self.canvas.create_window(0, len(slides) * self.slot_height,
+                                                       window=self.footer, anchor="nw")
+        self.footer.bind("<Configure>", lambda e: self.update_scrollregion())
+        self.canvas.configure(yscrollincrement=max(1, self.slot_height // 20))
+        self.update_scrollregion()
+
+    def new_form(self):
+        form = SlideForm(self.canvas, self.bg)
+        self.windows[form] = self.canvas.create_window(0, 0, window=form, anchor="sw")
+        return form
+
+    def park(self, form):
+        # Above the scroll region, where the view never goes.
+        self.canvas.coords(self.windows[form], 0, 0)
+        self.canvas.itemconfigure(self.windows[form], anchor="sw")
+
+    def update_scrollregion(self):
+        height = len(self.slides) * self.slot_height + self.footer.winfo_reqheight()
+        width = max(self.slot_width, self.footer.winfo_reqwidth())
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def bind_wheel(self):
+        self.canvas.bind_all("<MouseWheel>", self.on_wheel)
+        self.canvas.bind_all("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind_all("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+    def unbind_wheel(self):
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.unbind_all("<Button-4>")
+        self.canvas.unbind_all("<Button-5>")
+
+    def on_leave(self, event):
+        # Leave also fires when the pointer moves onto one of the forms
+        try:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            widget = None  # not a tkinter widget
+        path = str(self)
+        if widget is None or not (str(widget) == path or str(widget).startswith(path + ".")):
+            self.unbind_wheel()
+
+    def on_wheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        step = -1 if event.delta > 0 else 1
+        if abs(event.delta) >= 120:
+            step *= abs(event.delta) // 120
+        self.canvas.yview_scroll(step * 3, "units")
+
+    def visible_range(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), 1)
+        first = max(0, int(top // self.slot_height) - OVERSCAN)
+        last = min(len(self.slides), int(bottom // self.slot_height) + 1 + OVERSCAN)
+        return range(first, last)
+
+    def refresh(self):
+        wanted = self.visible_range()
+        for index in [index for index in self.bound if index not in wanted]:
+            form = self.bound.pop(index)
+            form.save(self.slides[index])
+            self.park(form)
+            self.free.append(form)
+        for index in wanted:
+            if index in self.bound:
+                continue
+            form = self.free.pop() if self.free else self.new_form()
+            form.load(index, self.slides[index])
+            window = self.windows[form]
+            self.canvas.coords(window, 0, index * self.slot_height)
+            self.canvas.itemconfigure(window, anchor="nw")
+            self.bound[index] = form
+
+    def flush(self):
+        # Writes the values of the forms on screen back to the slide list.
+        for index, form in self.bound.items():
+            form.save(self.slides[index])
+        return self.slides
+
+    def set_slides(self, slides):
+        # Starts over on another slide list (the next module) with the forms
+        # already built; the old list is not written to.
+        for form in self.bound.values():
+            self.park(form)
+            self.free.append(form)
+        self.bound = {}
+        self.slides = slides
+        self.canvas.coords(self.footer_window, 0, len(slides) * self.slot_height)
+        self.update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def destroy(self):
+        self.unbind_wheel()
+        super().destroy()
@@ -0,0 +1,201 @@
+"""
+All-or-nothing publishing for course builds.
+
+A StagedBuild collects every file a build writes in a hidden sibling of the
+course directory (~/.TITLE.staging-xxxx) and only moves them into the live
+tree on commit(), once the whole build has been written. Each file is
+published with os.replace, so the web server only ever sees complete old or
+complete new pages, never a half-written one.
+
+commit() first makes the staged tree durable and then writes a commit record
+(.commit, the list of staged files) into it; that record is the commit point.
+A build that stops before it is thrown away as a whole, and one that stops
+after it, in the middle of the renames, is rolled forward: the next
+StagedBuild for the course finishes publishing every committed staging
+directory it finds and removes the uncommitted ones. So after a crash the
+course ends up entirely old or entirely new, never a mix. (Two builds of the
+same course must not run at the same time; the later one would sweep the
+other's staging directory.)
+
+Durability is batched: on Linux the staged files are flushed with a single
+syncfs() of the course's filesystem (not every mounted one, as os.sync()
+does), elsewhere one fsync per file. Every live directory that received
+files is fsynced once after the renames.
+"""
+import ctypes
+import os
+import shutil
+import sys
+import tempfile
+
+COMMIT_FILE = ".commit"
+
+# Published last, so an interrupted commit never leaves a manifest that
+# claims pages which were not moved into place yet.
+LAST = ("index.html", ".build-manifest.json")
+
+
+def staging_prefix(course_dir):
+    parent, name = os.path.split(course_dir)
+    return os.path.join(parent, f".{name}.staging-")
+
+
+class StagedBuild:
+    def __init__(self, course_dir, stage_dir=None):
+        self.course_dir = os.path.abspath(course_dir)
+        if stage_dir is None:
+            recover(self.course_dir)
+            prefix = staging_prefix(self.course_dir)
+            stage_dir = tempfile.mkdtemp(prefix=os.path.basename(prefix), dir=os.path.dirname(prefix))
+        self.stage_dir = stage_dir
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+    def path(self, fileName, mode="w"):
+        # Where fileName (a path in the live course) should be written instead.
+        rel = os.path.relpath(os.path.abspath(fileName), self.course_dir)
+        if rel.startswith(os.pardir):
+            return fileName
+        staged = os.path.join(self.stage_dir, rel)
+        os.makedirs(os.path.dirname(staged), exist_ok=True)
+        if mode == "a" and not os.path.exists(staged) and os.path.exists(fileName):
+            # appends continue from the live file
+            shutil.copy2(fileName, staged)
+        return staged
+
+    def staged_files(self):
+        first, last = [], []
+        for folder, dirs, files in os.walk(self.stage_dir):
+            for name in files:
+                rel = os.path.relpath(os.path.join(folder, name), self.stage_dir)
+                if rel != COMMIT_FILE:
+                    (last if rel in LAST else first).append(rel)
+        first.sort()
+        last.sort(key=LAST.index)
+        return first + last
+
+    def commit(self):
+        files = self.staged_files()
+        sync_staged(self.stage_dir, files)
+        write_commit_record(self.stage_dir, files)
+        publish(self.stage_dir, self.course_dir, files)
+        return files
+
+    def abort(self):
+        shutil.rmtree(self.stage_dir, ignore_errors=True)
+
+
+def write_commit_record(stage_dir, files):
+    path = os.path.join(stage_dir, COMMIT_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write("".join(rel + "\n" for rel in files))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+    fsync_directory(stage_dir)
+
+
+def read_commit_record(stage_dir):
+    # The staged files of a committed build, or None if it never committed.
+    try:
+        with open(os.path.join(stage_dir, COMMIT_FILE), "r", encoding="utf-8") as f:
+            return f.read().splitlines()
+    except FileNotFoundError:
+        return None
+
+
+def publish(stage_dir, course_dir, files):
+    # Moves the committed files into place; files that are gone were already
+    # published by an earlier, interrupted attempt.
+    touched = set()
+    for rel in files:
+        source = os.path.join(stage_dir, rel)
+        if not os.path.exists(source):
+            continue
+        target = os.path.join(course_dir, rel)
+        folder = os.path.dirname(target)
+        while not os.path.isdir(folder):
+            # a new folder's own entry lives in its parent
+            touched.add(os.path.dirname(folder))
+            folder = os.path.dirname(folder)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(source, target)
+        touched.add(os.path.dirname(target))
+
+    for folder in sorted(touched):
+        fsync_directory(folder)
+    shutil.rmtree(stage_dir, ignore_errors=True)
+
+
+def recover(course_dir):
+    # Finishes the committed builds a crash left behind and drops the others.
+    prefix = staging_prefix(course_dir)
+    parent, start = os.path.split(prefix)
+    try:
+        names = os.listdir(parent)
+    except FileNotFoundError:
+        return
+    for name in sorted(names):
+        stage_dir = os.path.join(parent, name)
+        if not name.startswith(start) or not os.path.isdir(stage_dir):
+            continue
+        files = read_commit_record(stage_dir)
+        if files is None:
+            shutil.rmtree(stage_dir, ignore_errors=True)
+        else:
+            publish(stage_dir, course_dir, files)
+
+
+def sync_staged(stage_dir, files):
+    # Makes the staged files durable before the commit record vouches for them.
+    if syncfs(stage_dir):
+        return
+    folders = set()
+    for rel in files:
+        fsync_file(os.path.join(stage_dir, rel))
+        folders.add(os.path.dirname(os.path.join(stage_dir, rel)))
+    for folder in sorted(folders):
+        fsync_directory(folder)
+
+
+def syncfs(folder):
+    # One flush of the filesystem holding folder; False where there is no
+    # syncfs() (anything but Linux) or it failed.
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        call = ctypes.CDLL(None, use_errno=True).syncfs
+    except (OSError, AttributeError):
+        return False
+    fd = os.open(folder, os.O_RDONLY)
+    try:
+        return call(fd) == 0
+    finally:
+        os.close(fd)
+
+
+def fsync_file(path):
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
+
+
+def fsync_directory(folder):
+    # Persists the renames into folder; directories cannot be opened on Windows.
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,60 @@
+"""
+Status bar with a progress indicator for long editor tasks.
+
+Shown at the bottom of the editor window. A task (any object, e.g. a file
+loader or the export queue) calls start() with a message and an optional
+cancel callback, progress() as it goes and finish() when done. Several tasks
+can run at once: the bar shows their average progress and the message of the
+last one that reported, its Cancel button stops all of them, and both are
+only hidden once the last task has finished.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+
+class StatusBar(tk.Frame):
+    def __init__(self, parent):
+        super().__init__(parent, bd=1, relief="sunken")
+        self.message = tk.Label(self, anchor="w", font=("Arial", 10))
+        self.message.pack(side="left", fill="x", expand=True, padx=5)
+        self.cancel_button = tk.Button(self, text="Cancel", command=self.cancel)
+        self.bar = ttk.Progressbar(self, length=200, mode="determinate", maximum=1000)
+        # task -> [fraction done, cancel callback or None]
+        self.tasks = {}
+
+    def start(self, task, message, on_cancel=None):
+        self.tasks[task] = [0.0, on_cancel]
+        self.message.config(text=message)
+        self.show()
+
+    def progress(self, task, done, total, message=None):
+        if task not in self.tasks:
+            return
+        if total:
+            self.tasks[task][0] = min(done, total) / total
+        if message is not None:
+            self.message.config(text=message)
+        self.show()
+
+    def finish(self, task, message=""):
+        self.tasks.pop(task, None)
+        self.message.config(text=message)
+        self.show()
+
+    def show(self):
+        if not self.tasks:
+            self.bar.pack_forget()
+            self.cancel_button.pack_forget()
+            return
+        self.bar["value"] = 1000 * sum(done for done, _ in self.tasks.values()) / len(self.tasks)
+        if not self.bar.winfo_manager():
+            self.bar.pack(side="right", padx=5, pady=2)
+        if not any(on_cancel is not None for _, on_cancel in self.tasks.values()):
+            self.cancel_button.pack_forget()
+        elif not self.cancel_button.winfo_manager():
+            self.cancel_button.pack(side="right", padx=5)
+
+    def cancel(self):
+        for _, on_cancel in list(self.tasks.values()):
+            if on_cancel is not None:
+                on_cancel()
@@ -0,0 +1,147 @@
+"""
+Light/dark system theme for the Creator wizard.
+
+Asking the OS (the registry on Windows, `defaults` on macOS, `gsettings` on
+Linux) can mean a subprocess launch, and it used to run on the Tk thread
+before every Creator window opened. The answer is now kept in
+~/.ela/theme.json with the time it was taken. The wizard opens straight
+away with the cached theme (light when there is none yet); when the cached
+answer is older than THEME_TTL a background thread asks the OS again and
+updates the file, and the wizard re-themes its open window if the answer
+changed.
+"""
+import json
+import os
+import platform
+import subprocess
+import threading
+import time
+
+THEME_FILE = os.path.join(os.path.expanduser("~"), ".ela", "theme.json")
+# dark mode can follow the time of day, so the answer is not kept for long
+THEME_TTL = 60 * 60
+DEFAULT_THEME = "light"
+# seconds a theme query may take before it counts as failed
+DETECT_TIMEOUT = 5
+
+# window colours per theme; light buttons use each window's own accent colour
+PALETTES = {
+    "light": {"background": "#f4f4f4", "foreground": "#000000"},
+    "dark": {"background": "#2e2e2e", "foreground": "#ffffff", "button": "#444444"},
+}
+
+
+def detect_system_theme():
+    """
+    Detect the system theme (light or dark) for Windows, macOS, and Linux.
+    Returns:
+    str: 'light' or 'dark' based on the detected theme.
+    """
+    try:
+        system = platform.system()
+
+        if system == "Windows":
+            try:
+                from winreg import OpenKey, QueryValueEx, HKEY_CURRENT_USER
+
+                key = OpenKey(HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
+                value = QueryValueEx(key, "AppsUseLightTheme")[0]
+                return 'light' if value == 1 else 'dark'
+            except Exception as e:
+                print(f"Error detecting Windows theme: {e}")
+                return 'light'
+
+        elif system == "Darwin":  # macOS
+            try:
+                result = subprocess.run(
+                    ["defaults", "read", "-g", "AppleInterfaceStyle"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=DETECT_TIMEOUT
+                )
+                return 'dark' if "Dark" in result.stdout else 'light'
+            except Exception as e:
+                print(f"Error detecting macOS theme: {e}")
+                return 'light'
+
+        elif system == "Linux":
+            try:
+                result = subprocess.run(
+                    ["gsettings", "get", "org.gnome.desktop.interface", "color-scheme"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=DETECT_TIMEOUT
+                )
+                return 'dark' if "dark" in result.stdout.lower() else 'light'
+            except Exception as e:
+                print(f"Error detecting Linux theme: {e}")
+                return 'light'
+
+        else:
+            print(f"Unsupported platform: {system}")
+            return 'light'
+
+    except Exception as e:
+        print(f"Error detecting system theme: {e}")
+        return 'light'
+
+
+class SystemTheme:
+    def __init__(self, path=THEME_FILE, ttl=THEME_TTL, detect=detect_system_theme):
+        self.path = path
+        self.ttl = ttl
+        self.detect = detect
+        self.theme = DEFAULT_THEME
+        self.checked = 0.0
+        self.thread = None
+        self.result = None
+
+    def load(self):
+        # The cached theme, or DEFAULT_THEME; never asks the OS.
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data["theme"] in PALETTES:
+                self.theme = data["theme"]
+                self.checked = float(data["checked"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return self.theme
+
+    def stale(self):
+        # a timestamp in the future (clock changes) counts as stale too
+        return not 0 <= time.time() - self.checked <= self.ttl
+
+    def refresh(self):
+        # Asks the OS again on a background thread if the cache is stale.
+        if self.thread is None and self.stale():
+            self.thread = threading.Thread(target=self.run, name="system-theme", daemon=True)
+            self.thread.start()
+
+    def pending(self):
+        return self.thread is not None
+
+    def run(self):
+        theme = self.detect()
+        try:
+            self.save(theme)
+        except OSError as e:
+            print(f"Error saving theme cache: {e}")
+        self.result = theme
+
+    def save(self, theme):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"theme": theme, "checked": time.time()}, f)
+        os.replace(tmp_path, self.path)
+
+    def poll(self):
+        # Tk thread: None while a refresh runs, then the detected theme (once).
+        if self.thread is None or self.thread.is_alive():
+            return None
+        self.thread = None
+        self.theme = self.result
+        return self.theme
@@ -0,0 +1,78 @@
+"""
+Precompiled page templates for the course generators.
+
+Markup lives in the templates/ folder next to this file. A template uses
+{{name}} placeholders; everything else (CSS, JS and PHP braces included) is
+copied through untouched. Each template is read and compiled once per process
+into a str.format pattern, so rendering a page is a single format_map call and
+writing it is a single write.
+"""
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+class Template:
+    def __init__(self, source, name="<string>"):
+        self.name = name
+        self.source = source
+        parts = _PLACEHOLDER.split(source)
+        # split() alternates literal text and placeholder names
+        self.names = tuple(parts[1::2])
+        pattern = []
+        for i, part in enumerate(parts):
+            if i % 2:
+                pattern.append("{" + part + "}")
+            else:
+                pattern.append(part.replace("{", "{{").replace("}", "}}"))
+        self._pattern = "".join(pattern)
+
+    def render(self, **context):
+        try:
+            return self._pattern.format_map(context)
+        except KeyError as e:
+            raise KeyError(f"template {self.name} needs a value for {e}") from None
+
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    with open(os.path.join(TEMPLATE_DIR, name), "r", encoding="utf-8", newline="") as f:
+        return Template(f.read(), name)
+
+
+def render(name, **context):
+    return get_template(name).render(**context)
+
+
+@lru_cache(maxsize=None)
+def fingerprint():
+    # Hash of the whole template set; any markup change invalidates build manifests.
+    digest = hashlib.sha256()
+    for folder, dirs, files in sorted(os.walk(TEMPLATE_DIR)):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(folder, name)
+            digest.update(os.path.relpath(path, TEMPLATE_DIR).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def versioned_name(name):
+    # name with a hash of the template's content, e.g. js/quiz.3f2a9c01d4.js,
+    # so the file can be cached forever and a new version gets a new URL.
+    digest = hashlib.sha256(get_template(name).source.encode("utf-8")).hexdigest()[:10]
+    stem, extension = os.path.splitext(name)
+    return f"{stem}.{digest}{extension}"
+
+
+def write_file(fileName, content, mode="w"):
+    # One buffer, one write: the whole page is encoded up front.
+    with open(fileName, mode + "b") as f:
+        f.write(content.encode("utf-8"))
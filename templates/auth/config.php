@@ -0,0 +1,20 @@
+<?php
+header("Access-Control-Allow-Origin: *");
+header("Access-Control-Allow-Methods: GET, POST, OPTIONS");
+header("Access-Control-Allow-Headers: Content-Type, Authorization");
+
+$host = 'localhost'; 
+$db = 'dabasename_here';
+$user = 'user_here'; 
+$pass = 'password_here'; // your MySQL password
+
+try {
+    $pdo = new PDO("mysql:host=$host;dbname=$db", $user, $pass);
+    $pdo->setAttribute(PDO::ATTR_ERRMODE, PDO::ERRMODE_EXCEPTION);
+} catch (PDOException $e) {
+    // Log the error message
+    file_put_contents('error_log.txt', $e->getMessage(), FILE_APPEND);
+    // Show a generic error message to the user
+    die("Connection failed. Please try again later.");
+}
+?>
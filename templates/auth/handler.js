@@ -0,0 +1,94 @@
+// handler.js
+
+// Fetch userID from the server
+let userID = null;
+
+fetch('handler.php')
+    .then(response => {
+        if (!response.ok) {
+            throw new Error('Failed to fetch userID');
+        }
+        return response.json();
+    })
+    .then(data => {
+        userID = data.userID; // Store the userID globally
+        console.log('UserID fetched:', userID); // Optional: Log to confirm it worked
+    })
+    .catch(error => {
+        console.error('Error fetching userID:', error);
+        // Optional: Redirect to login if userID cannot be fetched
+        //window.location.href = 'https://elitelearnersacademy.com/LEARNING/login.php';
+    });
+
+// Function to send progress data to the server
+async function sendProgress(userID, courseID, moduleID, slideID, progressPercentage) {
+    try {
+        const response = await fetch('handler.php', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                action: 'sendProgress',
+                userID,
+                courseID,
+                moduleID,
+                slideID,
+                progressPercentage,
+            }),
+        });
+        const result = await response.json();
+        if (result.success) {
+            console.log('Progress sent successfully:', result);
+        } else {
+            console.error('Failed to send progress:', result.message);
+        }
+    } catch (error) {
+        console.error('Error sending progress:', error);
+    }
+}
+
+// Function to fetch updated progress and user information
+async function fetchProgress(userID, courseID) {
+    try {
+        const response = await fetch('handler.php', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                action: 'fetchProgress',
+                userID,
+                courseID,
+            }),
+        });
+        const result = await response.json();
+        if (result.success) {
+            console.log('Fetched progress successfully:', result);
+            updateUI(result.data);
+        } else {
+            console.error('Failed to fetch progress:', result.message);
+        }
+    } catch (error) {
+        console.error('Error fetching progress:', error);
+    }
+}
+
+// Function to update the HTML UI with fetched data
+function updateUI(data) {
+    const progressElement = document.getElementById('progressPercentage');
+    const usernameElement = document.getElementById('username');
+    const profilePictureElement = document.getElementById('profilePicture');
+    const certificateLinkElement = document.getElementById('certificateLink');
+
+    progressElement.textContent = `${data.progressPercentage}%`;
+    usernameElement.textContent = `${data.firstName} ${data.lastName}`;
+    profilePictureElement.src = data.profilePictureURL;
+
+    if (data.certificateURL) {
+        certificateLinkElement.href = data.certificateURL;
+        certificateLinkElement.style.display = 'block';
+    } else {
+        certificateLinkElement.style.display = 'none';
+    }
+}
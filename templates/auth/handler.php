@@ -0,0 +1,261 @@
+
+<?php
+session_start();
+require 'config.php';  // Assuming this contains the database connection and other settings
+
+ini_set('display_errors', 1);
+ini_set('display_startup_errors', 1);
+error_reporting(E_ALL);
+
+if (!isset($_SESSION['user_id'])) {
+    header("Location: login.php");
+    exit();
+}
+
+$userId = $_SESSION['user_id'];  // User ID from the session
+
+// Function to fetch Course, Module, and Slide IDs from the database
+function getIds($title, $moduleTitle, $slideName) {
+    global $pdo;
+
+    $sql = "SELECT c.CourseID, m.ModuleID, s.SlideID 
+            FROM Courses c 
+            JOIN Modules m ON c.CourseID = m.CourseID 
+            JOIN Slides s ON m.ModuleID = s.ModuleID 
+            WHERE c.Title = ? AND m.ModuleTitle = ? AND s.SlideName = ?";
+    $stmt = $pdo->prepare($sql);
+    $stmt->execute([$title, $moduleTitle, $slideName]);
+
+    return $stmt->fetch(PDO::FETCH_ASSOC);
+}
+
+// Function to fetch current progress for a user in a course and module
+// (both counts come back from one query)
+function fetchProgress($userID, $courseID, $moduleID) {
+    global $pdo;
+
+    $sql = "SELECT t.total_slides, c.completed_slides 
+            FROM (SELECT COUNT(*) AS total_slides 
+                  FROM Slides 
+                  WHERE ModuleID = ?) t 
+            CROSS JOIN (SELECT COUNT(*) AS completed_slides 
+                        FROM UserSlideProgress 
+                        WHERE UserID = ? AND CourseID = ? AND ModuleID = ? AND Completed = 1) c";
+    $stmt = $pdo->prepare($sql);
+    $stmt->execute([$moduleID, $userID, $courseID, $moduleID]);
+    $row = $stmt->fetch(PDO::FETCH_ASSOC);
+    $completedSlides = $row['completed_slides'];
+    $totalSlides = $row['total_slides'];
+
+    if ($totalSlides > 0) {
+        $progressPercentage = ($completedSlides / $totalSlides) * 100;
+    } else {
+        $progressPercentage = 0;
+    }
+
+    return ['completed_slides' => $completedSlides, 'total_slides' => $totalSlides, 'progressPercentage' => $progressPercentage];
+}
+
+// Function to fetch current progress for a user in a course
+// (one pass over the course's slides, each joined to its completion count)
+function fetchCourseProgress($userID, $courseID) {
+    global $pdo;
+
+    $sql = "SELECT COUNT(*) AS total_slides, COALESCE(SUM(done.completed), 0) AS completed_slides 
+            FROM Slides 
+            JOIN Modules ON Slides.ModuleID = Modules.ModuleID 
+            LEFT JOIN (SELECT SlideID, COUNT(*) AS completed 
+                       FROM UserSlideProgress 
+                       WHERE UserID = ? AND Completed = 1 
+                       GROUP BY SlideID) done ON done.SlideID = Slides.SlideID 
+            WHERE Modules.CourseID = ?";
+    $stmt = $pdo->prepare($sql);
+    $stmt->execute([$userID, $courseID]);
+    $row = $stmt->fetch(PDO::FETCH_ASSOC);
+    $completedSlides = $row['completed_slides'];
+    $totalSlides = $row['total_slides'];
+
+    if ($totalSlides > 0) {
+        $progressPercentage = ($completedSlides / $totalSlides) * 100;
+    } else {
+        $progressPercentage = 0;
+    }
+
+    return ['completed_slides' => $completedSlides, 'total_slides' => $totalSlides, 'progressPercentage' => $progressPercentage];
+}
+
+// Function to update the user's progress
+function updateProgress($userID, $courseID, $moduleID, $slideID) {
+    global $pdo;
+
+    // Check if the user has already completed the slide
+    $sql = "SELECT * 
+            FROM UserSlideProgress 
+            WHERE UserID = ? AND CourseID = ? AND ModuleID = ? AND SlideID = ?";
+    $stmt = $pdo->prepare($sql);
+    $stmt->execute([$userID, $courseID, $moduleID, $slideID]);
+
+    if ($stmt->fetch()) {
+        // If the user has already completed the slide, do nothing
+    } else {
+        // If the user has not completed the slide, insert a new record
+        $sql = "INSERT INTO UserSlideProgress (UserID, CourseID, ModuleID, SlideID, Completed) 
+                VALUES (?, ?, ?, ?, 1)";
+        $stmt = $pdo->prepare($sql);
+        $stmt->execute([$userID, $courseID, $moduleID, $slideID]);
+    }
+}
+
+// Function to get the total number of slides for a module
+function getModuleSlideCount($moduleID) {
+    global $pdo;
+
+    $stmt = $pdo->prepare("SELECT COUNT(*) FROM Slides WHERE ModuleID = ?");
+    $stmt->execute([$moduleID]);
+    return $stmt->fetchColumn();
+}
+
+// Function to get the slide index from the Slides table
+function getSlideIndex($moduleID, $slideID) {
+    global $pdo;
+
+    $stmt = $pdo->prepare("SELECT SlideIndex FROM Slides WHERE ModuleID = ? AND SlideID = ?");
+    $stmt->execute([$moduleID, $slideID]);
+    $row = $stmt->fetch(PDO::FETCH_ASSOC);
+
+    return $row ? $row['SlideIndex'] : 0;
+}
+
+// Function to calculate overall course progress
+// (the per-module slide and completion counts are grouped and summed in one
+// query instead of one fetchProgress() call per module)
+function getCourseProgress($userID, $courseID) {
+    global $pdo;
+
+    $sql = "SELECT COALESCE(SUM(t.total_slides), 0) AS total_slides, 
+                   COALESCE(SUM(c.completed_slides), 0) AS completed_slides 
+            FROM Modules m 
+            LEFT JOIN (SELECT s.ModuleID, COUNT(*) AS total_slides 
+                       FROM Slides s 
+                       JOIN Modules sm ON s.ModuleID = sm.ModuleID 
+                       WHERE sm.CourseID = ? 
+                       GROUP BY s.ModuleID) t ON t.ModuleID = m.ModuleID 
+            LEFT JOIN (SELECT ModuleID, COUNT(*) AS completed_slides 
+                       FROM UserSlideProgress 
+                       WHERE UserID = ? AND CourseID = ? AND Completed = 1 
+                       GROUP BY ModuleID) c ON c.ModuleID = m.ModuleID 
+            WHERE m.CourseID = ?";
+    $stmt = $pdo->prepare($sql);
+    $stmt->execute([$courseID, $userID, $courseID, $courseID]);
+    $row = $stmt->fetch(PDO::FETCH_ASSOC);
+
+    $totalSlides = $row['total_slides'];
+    $totalCompletedSlides = $row['completed_slides'];
+
+    if ($totalSlides > 0) {
+        $courseProgress = ($totalCompletedSlides / $totalSlides) * 100;
+    } else {
+        $courseProgress = 0;
+    }
+
+    return round($courseProgress, 2);
+}
+
+// Function to update the user's progress in the UserProgress table
+function updateUserProgress($userID, $courseID) {
+    global $pdo;
+
+    // Calculate the progress percentage
+    $progressData = fetchCourseProgress($userID, $courseID);
+    $progressPercentage = $progressData['progressPercentage'];
+
+    // Check if the user has an existing record in the UserProgress table
+    $sql = "SELECT * 
+            FROM UserProgress 
+            WHERE UserID = ? AND CourseID = ?";
+    $stmt = $pdo->prepare($sql);
+    $stmt->execute([$userID, $courseID]);
+    $userProgress = $stmt->fetch(PDO::FETCH_ASSOC);
+
+    if ($userProgress) {
+        // If the user has an existing record, update it
+        $sql = "UPDATE UserProgress 
+                SET ProgressPercentage = ?
+                WHERE UserID = ? AND CourseID = ?";
+        $stmt = $pdo->prepare($sql);
+        $stmt->execute([$progressPercentage, $userID, $courseID]);
+    } else {
+        // If the user does not have an existing record, insert a new one
+        $sql = "INSERT INTO UserProgress (UserID, CourseID, ProgressPercentage) 
+                VALUES (?, ?, ?)";
+        $stmt = $pdo->prepare($sql);
+        $stmt->execute([$userID, $courseID, $progressPercentage]);
+    }
+
+    return $progressData;
+}
+
+// Handle POST request to update progress
+if ($_SERVER['REQUEST_METHOD'] === 'POST') {
+    try {
+        $data = json_decode(file_get_contents('php://input'), true);
+
+        if (isset($data['title'], $data['moduleTitle'], $data['slideName'])) {
+            $title = $data['title'];
+            $moduleTitle = $data['moduleTitle'];
+            $slideName = $data['slideName'];
+
+            $ids = getIds($title, $moduleTitle, $slideName);
+
+            if ($ids) {
+                $courseID = $ids['CourseID'];
+                $moduleID = $ids['ModuleID'];
+                $slideID = $ids['SlideID'];
+
+                // Update the user's progress
+                updateProgress($userId, $courseID, $moduleID, $slideID);
+
+                // Update the user's progress in the UserProgress table
+                $progressData = updateUserProgress($userId, $courseID);
+
+                // Return updated progress as a JSON response
+                echo json_encode(['progress' => $progressData['progressPercentage']]);
+            } else {
+                echo json_encode(['error' => 'Invalid course, module, or slide']);
+            }
+        } else {
+            echo json_encode(['error' => 'Missing required data']);
+        }
+    } catch (PDOException $e) {
+        echo json_encode(['error' => 'Database error: ' . $e->getMessage()]);
+    } catch (Exception $e) {
+        echo json_encode(['error' => 'Error: ' . $e->getMessage()]);
+    }
+}
+
+// Handle GET request to get overall course progress
+if ($_SERVER['REQUEST_METHOD'] === 'GET' && isset($_GET['courseTitle'])) {
+    try {
+        $courseTitle = $_GET['courseTitle'];
+
+        $sql = "SELECT CourseID FROM Courses WHERE Title = ?";
+        $stmt = $pdo->prepare($sql);
+        $stmt->execute([$courseTitle]);
+        $course = $stmt->fetch(PDO::FETCH_ASSOC);
+
+        if ($course) {
+            $courseID = $course['CourseID'];
+            $courseProgress = getCourseProgress($userId, $courseID);
+
+            echo json_encode(['progress' => $courseProgress]);
+        } else {
+            echo json_encode(['error' => 'Course not found']);
+        }
+    } catch (PDOException $e) {
+        echo json_encode(['error' => 'Database error: ' . $e->getMessage()]);
+    } catch (Exception $e) {
+        echo json_encode(['error' => 'Error: ' . $e->getMessage()]);
+    }
+    exit();
+    }
+    ?>
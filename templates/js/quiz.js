@@ -0,0 +1,86 @@
+// Quiz and progress logic shared by every slide of a course.
+// Each slide describes itself in <script type="application/json" id="slide-data">:
+//   {"title", "moduleTitle", "slideName", "nextSlideName"[, "answerMode", "correctAnswer"]}
+(function () {
+    'use strict';
+
+    const dataElement = document.getElementById('slide-data');
+    const slide = dataElement ? JSON.parse(dataElement.textContent) : {};
+
+    function setResult(correct) {
+        const result = document.getElementById('result');
+        result.textContent = correct ? 'Correct!' : 'Incorrect, please try again.';
+        result.style.color = correct ? 'green' : 'red';
+        document.getElementById('nextButton').disabled = !correct;
+        if (correct) {
+            document.getElementById('submitButton').disabled = true;
+        }
+    }
+
+    function checkChoice() {
+        const options = document.querySelectorAll('input[name="opt"]');
+        let selected = null;
+
+        options.forEach((option) => {
+            if (option.checked) {
+                selected = option;
+            }
+            // Reset the border style for all options
+            option.nextElementSibling.style.border = 'none';
+        });
+
+        const correct = selected !== null && selected.value === slide.correctAnswer;
+        if (correct) {
+            selected.nextElementSibling.style.border = '2px solid green';
+        } else if (selected) {
+            selected.nextElementSibling.style.border = '2px solid red';
+        }
+        setResult(correct);
+    }
+
+    function checkText() {
+        // Case insensitive, surrounding whitespace ignored
+        const userInput = document.getElementById('userAnswer');
+        const correct = userInput.value.trim().toLowerCase() === String(slide.correctAnswer).trim().toLowerCase();
+        userInput.style.border = correct ? '2px solid green' : '2px solid red';
+        setResult(correct);
+    }
+
+    window.checkAnswer = function () {
+        if (slide.answerMode === 'choice') {
+            checkChoice();
+        } else {
+            checkText();
+        }
+    };
+
+    window.goToNextQuestion = function () {
+        window.location.href = slide.nextSlideName;
+    };
+
+    // Records the slide as completed before moving on
+    const continueButton = document.getElementById('continue-button');
+    if (continueButton) {
+        // the inline onclick would leave the page before the POST is sent
+        continueButton.onclick = null;
+        continueButton.addEventListener('click', () => {
+            fetch('../AUTH/handler.php', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    title: slide.title,
+                    moduleTitle: slide.moduleTitle,
+                    slideName: slide.slideName
+                })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data))
+            .catch(error => console.error('Error:', error))
+            .finally(() => {
+                location.href = slide.nextSlideName;
+            });
+        });
+    }
+})();
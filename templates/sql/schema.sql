@@ -0,0 +1,58 @@
+-- Tables read and written by AUTH/handler.php, keyed for the lookups it
+-- makes. Safe to run on an existing database: tables are only created when
+-- they are missing.
+
+CREATE TABLE IF NOT EXISTS Courses (
+    CourseID INT NOT NULL AUTO_INCREMENT,
+    Title VARCHAR(255) NOT NULL,
+    PRIMARY KEY (CourseID),
+    -- getIds() and the course progress request: WHERE Title = ?
+    UNIQUE KEY uq_courses_title (Title)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS Modules (
+    ModuleID INT NOT NULL AUTO_INCREMENT,
+    CourseID INT NOT NULL,
+    ModuleTitle VARCHAR(255) NOT NULL,
+    PRIMARY KEY (ModuleID),
+    -- getIds(): c.CourseID = m.CourseID AND m.ModuleTitle = ?
+    -- progress functions: WHERE CourseID = ?
+    UNIQUE KEY uq_modules_course_title (CourseID, ModuleTitle),
+    CONSTRAINT fk_modules_course FOREIGN KEY (CourseID) REFERENCES Courses (CourseID) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS Slides (
+    SlideID INT NOT NULL AUTO_INCREMENT,
+    ModuleID INT NOT NULL,
+    SlideName VARCHAR(255) NOT NULL,
+    SlideIndex INT NOT NULL,
+    PRIMARY KEY (SlideID),
+    -- getIds(): m.ModuleID = s.ModuleID AND s.SlideName = ?
+    UNIQUE KEY uq_slides_module_name (ModuleID, SlideName),
+    -- getSlideIndex(): WHERE ModuleID = ? AND SlideID = ?, answered from the
+    -- index alone (it carries SlideID); getModuleSlideCount() and the
+    -- progress counts: WHERE ModuleID = ?
+    UNIQUE KEY uq_slides_module_index (ModuleID, SlideIndex),
+    CONSTRAINT fk_slides_module FOREIGN KEY (ModuleID) REFERENCES Modules (ModuleID) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS UserSlideProgress (
+    UserID INT NOT NULL,
+    CourseID INT NOT NULL,
+    ModuleID INT NOT NULL,
+    SlideID INT NOT NULL,
+    Completed TINYINT(1) NOT NULL DEFAULT 0,
+    -- updateProgress(): WHERE UserID = ? AND CourseID = ? AND ModuleID = ? AND SlideID = ?
+    -- fetchProgress(), getCourseProgress(): its (UserID, CourseID, ModuleID) prefix
+    PRIMARY KEY (UserID, CourseID, ModuleID, SlideID),
+    -- fetchCourseProgress(): WHERE UserID = ? AND Completed = 1 GROUP BY SlideID
+    KEY idx_progress_user_completed (UserID, Completed, SlideID)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS UserProgress (
+    UserID INT NOT NULL,
+    CourseID INT NOT NULL,
+    ProgressPercentage DECIMAL(5,2) NOT NULL DEFAULT 0,
+    -- updateUserProgress(): WHERE UserID = ? AND CourseID = ?
+    PRIMARY KEY (UserID, CourseID)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -0,0 +1,43 @@
+-- Course, modules and slides of one built course, for AUTH/handler.php.
+-- Run after schema.sql; running it again after a rebuild brings the rows in
+-- line with the new build and keeps the learners' progress.
+
+START TRANSACTION;
+
+INSERT INTO Courses (Title) VALUES ({{title}})
+    ON DUPLICATE KEY UPDATE CourseID = LAST_INSERT_ID(CourseID);
+SET @course = LAST_INSERT_ID();
+
+-- every slide of the course as built; a module without slides has one row
+-- with no slide
+DROP TEMPORARY TABLE IF EXISTS SeedSlides;
+CREATE TEMPORARY TABLE SeedSlides (
+    ModuleTitle VARCHAR(255) NOT NULL,
+    SlideName VARCHAR(255) NULL,
+    SlideIndex INT NULL
+) DEFAULT CHARSET=utf8mb4;
+{{seed_rows}}
+
+-- modules and slides that are no longer in the course
+DELETE FROM Modules
+WHERE CourseID = @course AND ModuleTitle NOT IN (SELECT ModuleTitle FROM SeedSlides);
+
+DELETE s FROM Slides s
+JOIN Modules m ON s.ModuleID = m.ModuleID
+LEFT JOIN SeedSlides seed ON seed.ModuleTitle = m.ModuleTitle AND seed.SlideName = s.SlideName
+WHERE m.CourseID = @course AND seed.ModuleTitle IS NULL;
+
+INSERT INTO Modules (CourseID, ModuleTitle)
+SELECT DISTINCT @course, ModuleTitle FROM SeedSlides
+    ON DUPLICATE KEY UPDATE ModuleID = ModuleID;
+
+INSERT INTO Slides (ModuleID, SlideName, SlideIndex)
+SELECT m.ModuleID, seed.SlideName, seed.SlideIndex
+FROM SeedSlides seed
+JOIN Modules m ON m.CourseID = @course AND m.ModuleTitle = seed.ModuleTitle
+WHERE seed.SlideName IS NOT NULL
+    ON DUPLICATE KEY UPDATE SlideIndex = seed.SlideIndex;
+
+DROP TEMPORARY TABLE SeedSlides;
+
+COMMIT;
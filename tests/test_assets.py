@@ -0,0 +1,50 @@
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assets import AssetStore
+from export import course_files
+
+
+class AssetStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.store = os.path.join(self.root.name, "store")
+
+    def upload(self, course, data=b"lecture video"):
+        assets_dir = os.path.join(self.root.name, course, "ASSETS")
+        os.makedirs(assets_dir)
+        with open(os.path.join(assets_dir, "lecture.mp4"), "wb") as f:
+            f.write(data)
+        return AssetStore(assets_dir, self.store), assets_dir
+
+    def test_upload_stays_and_shares_the_read_only_blob(self):
+        assets, assets_dir = self.upload("A")
+        name = assets.resolve("lecture.mp4")
+        upload = os.stat(os.path.join(assets_dir, "lecture.mp4"))
+        stored = os.stat(os.path.join(assets_dir, name))
+        self.assertTrue(os.path.samestat(upload, stored))
+        self.assertEqual(stat.S_IMODE(stored.st_mode), 0o444)
+
+    def test_same_upload_in_another_course_links_to_the_stored_blob(self):
+        first, first_dir = self.upload("A")
+        second, second_dir = self.upload("B")
+        name = first.resolve("lecture.mp4")
+        self.assertEqual(second.resolve("lecture.mp4"), name)
+        self.assertTrue(os.path.samestat(os.stat(os.path.join(first_dir, name)),
+                                         os.stat(os.path.join(second_dir, "lecture.mp4"))))
+
+    def test_export_keeps_the_hashed_name_only(self):
+        assets, assets_dir = self.upload("A")
+        name = assets.resolve("lecture.mp4")
+        course_dir = os.path.dirname(assets_dir)
+        self.assertEqual([rel for rel, path in course_files(course_dir)], [f"ASSETS/{name}"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draft_journal import DraftJournal
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DraftJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "draft.jsonl")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def journal(self, **options):
+        # no writer thread: the test decides when flush() runs
+        return DraftJournal(self.path, clock=self.clock, background=False, **options)
+
+    def lines(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return [json.loads(line) for line in f]
+        except FileNotFoundError:
+            return []
+
+    def test_steady_typing_is_written_once_per_max_delay(self):
+        # a keystroke every 10 ms never settles for the 50 ms debounce, so
+        # only the 200 ms cap writes while typing goes on
+        journal = self.journal(debounce=0.05, max_delay=0.2)
+        writes = []
+        for i in range(40):
+            self.clock.now = i * 0.01
+            journal.record({"title": "x" * (i + 1)})
+            if journal.flush():
+                writes.append(i)
+        self.assertEqual(writes, [20])
+        self.assertEqual(self.lines(), [{"changes": {"title": "x" * 21}}])
+
+        self.clock.now = 0.39 + 0.05  # the burst has settled
+        self.assertTrue(journal.flush())
+        self.assertEqual(len(self.lines()), 2)
+        self.assertEqual(DraftJournal(self.path).load(), {"title": "x" * 40})
+
+    def test_single_edit_is_written_after_the_debounce(self):
+        journal = self.journal(debounce=0.05, max_delay=1.0)
+        journal.record({"author": "Ada"})
+        self.clock.now = 0.04
+        self.assertFalse(journal.flush())
+        self.assertEqual(self.lines(), [])
+        self.clock.now = 0.05
+        self.assertTrue(journal.flush())
+        self.assertEqual(self.lines(), [{"changes": {"author": "Ada"}}])
+
+    def test_close_writes_what_is_pending(self):
+        journal = self.journal(debounce=0.05)
+        journal.record({"author": "Ada"})
+        journal.close()
+        self.assertEqual(self.lines(), [{"changes": {"author": "Ada"}}])
+
+    def test_writer_thread_writes_on_close(self):
+        journal = DraftJournal(self.path, debounce=60)
+        journal.record({"author": "Ada"})
+        journal.close()
+        self.assertEqual(self.lines(), [{"changes": {"author": "Ada"}}])
+
+    def test_torn_line_is_compacted_away(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"snapshot": {"title": "a"}}\n{"changes": {"tit')
+        journal = self.journal(debounce=0.01)
+        self.assertEqual(journal.load(), {"title": "a"})
+        journal.record({"author": "b"})
+        journal.close()
+        self.assertEqual(self.lines(), [{"snapshot": {"title": "a", "author": "b"}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from export_queue import UMASK, ExportJob, ExportQueue
+
+
+class Snapshot:
+    text = "hello"
+
+
+def write_text(snapshot, path, progress):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(snapshot.text)
+
+
+class ExportJobTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.folder.name, name)
+
+    def run_job(self, path):
+        ExportJob(write_text, Snapshot(), path).run()
+
+    def mode(self, path):
+        return stat.S_IMODE(os.stat(path).st_mode)
+
+    def test_keeps_mode_of_replaced_file(self):
+        for mode in (0o600, 0o755):
+            path = self.path(f"doc-{mode:o}.txt")
+            with open(path, "w") as f:
+                f.write("old")
+            os.chmod(path, mode)
+            self.run_job(path)
+            self.assertEqual(self.mode(path), mode)
+
+    def test_new_file_follows_umask(self):
+        path = self.path("new.txt")
+        self.run_job(path)
+        self.assertEqual(self.mode(path), 0o666 & ~UMASK)
+
+    def test_writes_through_symlink(self):
+        target = self.path("target.txt")
+        with open(target, "w") as f:
+            f.write("old")
+        link = self.path("link.txt")
+        os.symlink(target, link)
+        self.run_job(link)
+        self.assertTrue(os.path.islink(link))
+        with open(target, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "hello")
+        self.assertEqual(sorted(os.listdir(self.folder.name)), ["link.txt", "target.txt"])
+
+
+class FakeText:
+    # what ExportQueue uses of the Text widget; after() callbacks never run
+    def get(self, start, end):
+        return "hello"
+
+    def tag_ranges(self, tag):
+        return ()
+
+    def after(self, delay, callback):
+        return "after#1"
+
+    def after_cancel(self, job):
+        pass
+
+
+class ExportQueueTest(unittest.TestCase):
+    def test_close_stops_running_and_waiting_exports(self):
+        started = threading.Event()
+
+        def slow_export(snapshot, path, progress):
+            started.set()
+            while True:
+                progress(0, 1)  # raises once the job is cancelled
+                time.sleep(0.01)
+
+        with tempfile.TemporaryDirectory() as folder:
+            exports = ExportQueue(FakeText(), workers=1)
+            running = exports.submit(slow_export, os.path.join(folder, "a.txt"), tags=())
+            waiting = exports.submit(slow_export, os.path.join(folder, "b.txt"), tags=())
+            self.assertTrue(started.wait(5))
+            exports.close()
+            running.future.exception(timeout=5)
+            self.assertTrue(waiting.future.cancelled())
+            self.assertEqual(os.listdir(folder), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exporters import DocumentSnapshot
+
+
+class FakeText:
+    # get() and tag_ranges() of a tk.Text holding text, with tag ranges given
+    # as Tk indices
+    def __init__(self, text, ranges):
+        self.text = text
+        self.ranges = ranges
+
+    def get(self, start, end):
+        return self.text
+
+    def tag_ranges(self, tag):
+        return self.ranges.get(tag, ())
+
+
+class DocumentSnapshotTest(unittest.TestCase):
+    def test_range_ending_at_tk_end(self):
+        # Select All + Bold on "abc\ndef" tags 1.0 to "end", which is 3.0
+        widget = FakeText("abc\ndef", {"bold": ("1.0", "3.0")})
+        snapshot = DocumentSnapshot.from_text_widget(widget)
+        self.assertEqual(snapshot.ranges["bold"], ((0, 7),))
+        self.assertEqual(list(snapshot.iter_paragraph_runs()),
+                         [[("abc", frozenset(["bold"]))], [("def", frozenset(["bold"]))]])
+
+    def test_range_ending_at_the_final_newline(self):
+        widget = FakeText("abc\ndef", {"italic": ("2.1", "2.4")})
+        snapshot = DocumentSnapshot.from_text_widget(widget)
+        self.assertEqual(snapshot.ranges["italic"], ((5, 7),))
+
+    def test_runs_cover_the_text(self):
+        widget = FakeText("one two\nthree", {"bold": ("1.4", "2.2"), "underline": ("1.0", "1.3")})
+        snapshot = DocumentSnapshot.from_text_widget(widget)
+        runs = list(snapshot.iter_runs())
+        self.assertEqual("".join(snapshot.text[start:end] for start, end, tags in runs), snapshot.text)
+        self.assertEqual(runs[0], (0, 3, frozenset(["underline"])))
+        self.assertEqual(runs[2], (4, 10, frozenset(["bold"])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_registry import ImageRegistry
+
+
+class FakeText:
+    # image and after_idle() calls of a tk.Text; idle callbacks run on demand
+    def __init__(self):
+        self.images = {}
+        self.idle = {}
+        self.walks = 0
+
+    def image_create(self, index, image):
+        self.images[f"image{len(self.images) + 1}"] = image
+
+    def image_names(self):
+        self.walks += 1
+        return list(self.images)
+
+    def image_cget(self, name, option):
+        return self.images[name]
+
+    def after_idle(self, callback, *args):
+        job = f"after#{len(self.idle) + 1}"
+        self.idle[job] = (callback, args)
+        return job
+
+    def after_cancel(self, job):
+        self.idle.pop(job, None)
+
+    def run_idle(self):
+        idle, self.idle = self.idle, {}
+        for callback, args in idle.values():
+            callback(*args)
+
+
+class Registry(ImageRegistry):
+    # PhotoImages need a display; any unique object stands in for one
+    def photo(self, path, size=None):
+        return self.photos.setdefault((path, size), f"photo:{path}")
+
+
+class ImageRegistryTest(unittest.TestCase):
+    def test_inserts_queue_one_prune(self):
+        widget, registry = FakeText(), Registry()
+        for i in range(100):
+            registry.embed(widget, "end", f"{i}.png")
+        self.assertEqual(widget.walks, 0)
+        self.assertEqual(len(widget.idle), 1)
+        widget.run_idle()
+        self.assertEqual(widget.walks, 1)
+        self.assertEqual(len(registry.photos), 100)
+
+    def test_prune_releases_deleted_images(self):
+        widget, registry = FakeText(), Registry()
+        registry.embed(widget, "end", "a.png")
+        registry.embed(widget, "end", "b.png")
+        del widget.images["image1"]
+        registry.prune(widget)
+        self.assertEqual(list(registry.photos), [("b.png", None)])
+        self.assertEqual(widget.idle, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
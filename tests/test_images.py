@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import images
+
+
+class VariantWidthsTest(unittest.TestCase):
+    def test_never_upscales(self):
+        self.assertEqual(images.variant_widths(3000), [480, 960, 1600])
+        self.assertEqual(images.variant_widths(1000), [480, 960, 1000])
+        self.assertEqual(images.variant_widths(300), [300])
+
+    def test_configured_width_equal_to_the_original(self):
+        self.assertEqual(images.variant_widths(1600), [480, 960, 1600])
+        self.assertEqual(images.variant_widths(960), [480, 960])
+
+
+@unittest.skipUnless(images.available_formats(), "Pillow without WebP/AVIF")
+class OptimizeTest(unittest.TestCase):
+    def test_variants_go_to_output_dir(self):
+        from PIL import Image
+
+        with tempfile.TemporaryDirectory() as live, tempfile.TemporaryDirectory() as staged:
+            source = os.path.join(live, "photo.jpg")
+            Image.new("RGB", (1000, 500), "red").save(source)
+            variants = images.optimize(source, staged, formats=("webp",))
+            self.assertEqual(variants, [["webp", 480, "photo-480w.webp"], ["webp", 960, "photo-960w.webp"],
+                                        ["webp", 1000, "photo-1000w.webp"]])
+            self.assertEqual(os.listdir(live), ["photo.jpg"])
+            self.assertEqual(sorted(os.listdir(staged)), sorted(name for _, _, name in variants))
+
+
+if __name__ == "__main__":
+    unittest.main()
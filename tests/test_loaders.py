@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import loaders
+
+DOCUMENT = ('<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:body><w:p><w:r><w:t>Hello</w:t></w:r></w:p></w:body></w:document>')
+
+
+class DocxLoaderParseTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.path = os.path.join(folder.name, "doc.docx")
+        with zipfile.ZipFile(self.path, "w") as archive:
+            archive.writestr("word/document.xml", DOCUMENT)
+
+    def items(self):
+        loader = loaders.DocxLoader(None, self.path)
+        loader.parse()
+        items = []
+        while not loader.batches.empty():
+            items.append(loader.batches.get_nowait())
+        return items
+
+    def test_document_ends_with_done(self):
+        items = self.items()
+        self.assertEqual(items[0][:2], ("batch", [("Hello", ())]))
+        self.assertEqual(items[-1][0], "done")
+
+    def test_any_parser_failure_ends_with_error(self):
+        for error in (NotImplementedError("compression type 99"), RuntimeError("File is encrypted"),
+                      UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")):
+            with mock.patch.object(loaders, "iter_docx_paragraphs", side_effect=error):
+                kind, value, done = self.items()[-1]
+            self.assertEqual(kind, "error")
+            self.assertIs(value, error)
+
+
+if __name__ == "__main__":
+    unittest.main()
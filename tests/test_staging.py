@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from staging import StagedBuild, sync_staged, write_commit_record
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class StagedBuildTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.course = os.path.join(self.root.name, "COURSE")
+        write(os.path.join(self.course, "module1", "module_1_slide_1.html"), "old 1")
+        write(os.path.join(self.course, "module1", "module_1_slide_2.html"), "old 2")
+
+    def stage(self, text):
+        build = StagedBuild(self.course)
+        for name in ("module_1_slide_1.html", "module_1_slide_2.html"):
+            write(build.path(os.path.join(self.course, "module1", name)), text)
+        write(build.path(os.path.join(self.course, "module2", "module_2_slide_1.html")), text)
+        return build
+
+    def slides(self):
+        folder = os.path.join(self.course, "module1")
+        return [read(os.path.join(folder, name)) for name in sorted(os.listdir(folder))]
+
+    def staging_dirs(self):
+        return [name for name in os.listdir(self.root.name) if ".staging-" in name]
+
+    def test_commit_publishes_everything(self):
+        self.stage("new").commit()
+        self.assertEqual(self.slides(), ["new", "new"])
+        self.assertEqual(read(os.path.join(self.course, "module2", "module_2_slide_1.html")), "new")
+        self.assertEqual(self.staging_dirs(), [])
+
+    def test_uncommitted_build_is_dropped(self):
+        self.stage("new")  # stopped before commit()
+        StagedBuild(self.course).abort()
+        self.assertEqual(self.slides(), ["old 1", "old 2"])
+        self.assertEqual(self.staging_dirs(), [])
+
+    def test_interrupted_commit_is_rolled_forward(self):
+        build = self.stage("new")
+        files = build.staged_files()
+        sync_staged(build.stage_dir, files)
+        write_commit_record(build.stage_dir, files)
+        # the crash: only the first file was moved into place
+        os.replace(os.path.join(build.stage_dir, files[0]), os.path.join(self.course, files[0]))
+        self.assertEqual(self.slides(), ["new", "old 2"])
+
+        StagedBuild(self.course).abort()
+        self.assertEqual(self.slides(), ["new", "new"])
+        self.assertEqual(self.staging_dirs(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
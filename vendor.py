@@ -0,0 +1,131 @@
+"""
+Offline copies of the third-party CSS/JS the generated pages link.
+
+Slides, index.html, celebration.html and the course description page load
+Bootstrap, Font Awesome, styl.css, celebration.css/js, color-modes.js and the
+sidebar files from elitelearnersacademy.com and cdnjs. With a vendor cache
+(~/.ela/vendor by default) those files are copied into the course's
+ASSETS/vendor/ folder at build time and the pages are rewritten to link the
+local copies, so a learner's browser talks to one host only and a course can
+be checked without network access.
+
+The cache mirrors the vendor folder, using the paths in VENDOR_FILES:
+
+    css/bootstrap.min.css  css/font-awesome.min.css  fonts/...  js/color-modes.js
+    critical.css           (optional, inlined into every page's <head>)
+
+Only the files present in the cache are vendored; other links stay as they
+are. When critical.css exists, the vendored stylesheets are loaded as
+non-blocking preloads and the inlined rules carry the first paint.
+"""
+import filecmp
+import functools
+import hashlib
+import os
+import re
+import shutil
+
+VENDOR_CACHE = os.path.join(os.path.expanduser("~"), ".ela", "vendor")
+
+CRITICAL_CSS = "critical.css"
+
+# external URL -> path under ASSETS/vendor/ (and in the cache)
+VENDOR_FILES = {
+    "https://elitelearnersacademy.com/CSS/bootstrap.min.css": "css/bootstrap.min.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/4.7.0/css/font-awesome.min.css": "css/font-awesome.min.css",
+    "https://elitelearnersacademy.com/LEARNING/styl.css": "css/styl.css",
+    "https://elitelearnersacademy.com/CSS/celebration.css": "css/celebration.css",
+    "https://elitelearnersacadmy.com/CSS/sidebars.css": "css/sidebars.css",
+    "https://elitelearnersacademy.com/JS/color-modes.js": "js/color-modes.js",
+    "https://elitelearnersacademy.com/JS/celebration.js": "js/celebration.js",
+    "https://elitelearnersacademy.com/JS/bootstrap.bundle.min.js": "js/bootstrap.bundle.min.js",
+    "https://elitelearnersacademy.com/JS/sidebars.js": "js/sidebars.js",
+}
+
+_HEAD = re.compile(r"<head\b[^>]*>", re.IGNORECASE)
+_LINK = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_STYLESHEET = re.compile(r"""\brel\s*=\s*["']?stylesheet\b""", re.IGNORECASE)
+
+
+def load_vendor(cache_dir=VENDOR_CACHE):
+    # A Vendor for cache_dir, or None when there is no cache to vendor from.
+    if cache_dir and os.path.isdir(cache_dir):
+        return Vendor(cache_dir)
+    return None
+
+
+class Vendor:
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.critical_css = ""
+        critical_path = os.path.join(self.cache_dir, CRITICAL_CSS)
+        if os.path.isfile(critical_path):
+            with open(critical_path, "r", encoding="utf-8") as f:
+                self.critical_css = f.read().strip()
+        self.urls = {url: rel for url, rel in VENDOR_FILES.items()
+                     if os.path.isfile(os.path.join(self.cache_dir, rel))}
+
+    def files(self):
+        # Everything in the cache except critical.css, as paths relative to it.
+        found = []
+        for folder, dirs, names in os.walk(self.cache_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in names:
+                rel = os.path.relpath(os.path.join(folder, name), self.cache_dir).replace(os.sep, "/")
+                if rel != CRITICAL_CSS and not name.startswith("."):
+                    found.append(rel)
+        return sorted(found)
+
+    @functools.cached_property
+    def fingerprint(self):
+        # Part of every vendored page's manifest inputs: a new cache content
+        # rebuilds the pages that inline or link it.
+        digest = hashlib.sha256()
+        for rel in self.files() + ([CRITICAL_CSS] if self.critical_css else []):
+            digest.update(rel.encode("utf-8") + b"\0")
+            with open(os.path.join(self.cache_dir, rel), "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def install(self, vendor_dir, output_path=None):
+        # Copies the cache into vendor_dir, skipping files that are already
+        # identical. output_path maps a live path to where it should be
+        # written (a staged build); returns the files copied.
+        copied = []
+        for rel in self.files():
+            source = os.path.join(self.cache_dir, rel)
+            target = os.path.join(vendor_dir, *rel.split("/"))
+            if os.path.isfile(target) and filecmp.cmp(source, target, shallow=False):
+                continue
+            destination = output_path(target) if output_path else target
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            tmp_path = destination + ".tmp"
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, destination)
+            copied.append(rel)
+        return copied
+
+    def rewrite(self, html, prefix):
+        # Points the page's vendored links at prefix + "vendor/..." (prefix is
+        # the page's relative path to ASSETS/) and inlines critical.css.
+        if not self.urls:
+            return html
+        deferred = bool(self.critical_css)
+
+        def link(match):
+            tag = match.group(0)
+            if deferred and _STYLESHEET.search(tag):
+                for url in self.urls:
+                    if url in tag:
+                        href = prefix + "vendor/" + self.urls[url]
+                        return (f"<link rel=\"preload\" href=\"{href}\" as=\"style\" "
+                                f"onload=\"this.onload=null;this.rel='stylesheet'\">"
+                                f"<noscript><link rel=\"stylesheet\" href=\"{href}\"></noscript>")
+            return tag
+
+        html = _LINK.sub(link, html)
+        for url, rel in self.urls.items():
+            html = html.replace(url, prefix + "vendor/" + rel)
+        if self.critical_css:
+            html = _HEAD.sub(lambda m: m.group(0) + f"<style>{self.critical_css}</style>", html, count=1)
+        return html